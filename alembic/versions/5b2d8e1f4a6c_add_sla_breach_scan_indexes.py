@@ -0,0 +1,38 @@
+"""Add SLA breach-scan indexes
+
+Revision ID: 5b2d8e1f4a6c
+Revises: 9e4f2a7c1b3d
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2d8e1f4a6c'
+down_revision: Union[str, Sequence[str], None] = '9e4f2a7c1b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Breach-scan indexes: monitors filter open trackers by status and due time
+    op.create_index('ix_sla_tracking_status_due', 'workflow_sla_tracking', ['status', 'completion_due_at'], unique=False)
+    op.create_index(
+        'ix_sla_tracking_open_due',
+        'workflow_sla_tracking',
+        ['completion_due_at'],
+        unique=False,
+        sqlite_where=sa.text('completed_at IS NULL'),
+        postgresql_where=sa.text('completed_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sla_tracking_open_due', table_name='workflow_sla_tracking')
+    op.drop_index('ix_sla_tracking_status_due', table_name='workflow_sla_tracking')
@@ -0,0 +1,31 @@
+"""Drop redundant id indexes on SLA tables
+
+Revision ID: 7c3e9f2a5d8b
+Revises: 5b2d8e1f4a6c
+Create Date: 2026-10-17 16:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9f2a5d8b'
+down_revision: Union[str, Sequence[str], None] = '5b2d8e1f4a6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary keys already index id
+    op.drop_index(op.f('ix_workflow_sla_tracking_id'), table_name='workflow_sla_tracking')
+    op.drop_index(op.f('ix_workflow_sla_policies_id'), table_name='workflow_sla_policies')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_workflow_sla_policies_id'), 'workflow_sla_policies', ['id'], unique=False)
+    op.create_index(op.f('ix_workflow_sla_tracking_id'), 'workflow_sla_tracking', ['id'], unique=False)
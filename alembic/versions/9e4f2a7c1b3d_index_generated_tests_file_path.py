@@ -0,0 +1,29 @@
+"""Index generated_tests.file_path
+
+Revision ID: 9e4f2a7c1b3d
+Revises: 33041c5cbcd4
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f2a7c1b3d'
+down_revision: Union[str, Sequence[str], None] = '33041c5cbcd4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Test execution results are written back by file path
+    op.create_index(op.f('ix_generated_tests_file_path'), 'generated_tests', ['file_path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_generated_tests_file_path'), table_name='generated_tests')
@@ -17,60 +17,63 @@ down_revision: Union[str, Sequence[str], None] = 'd223e3eba919'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Column indexes created with the table, in creation order. The primary key
+# already covers id, the UNIQUE constraint covers event_id, and the
+# aggregate/sequence composite also serves plain aggregate_id lookups as a
+# leading-column prefix.
+WORKFLOW_EVENT_INDEXES = (
+    ('ix_workflow_events_event_type', ['event_type']),
+    ('ix_workflow_events_correlation_id', ['correlation_id']),
+    ('ix_workflow_events_causation_id', ['causation_id']),
+    ('ix_workflow_events_user_id', ['user_id']),
+    ('ix_workflow_events_aggregate_sequence', ['aggregate_id', 'sequence_number']),
+)
+
 
 def upgrade() -> None:
     """Upgrade schema."""
+    # Store processing status as a constrained short enum rather than free text
+    processing_status_enum = sa.Enum(
+        'pending', 'processed', 'failed', 'retrying',
+        name='eventprocessingstatus',
+        native_enum=False,
+        create_constraint=True
+    )
+    
     # Create workflow_events table for event sourcing
     op.create_table(
         'workflow_events',
-        sa.Column('id', sa.Integer(), nullable=False, primary_key=True, index=True),
-        sa.Column('event_id', sa.String(length=255), nullable=False, unique=True, index=True),
-        sa.Column('event_type', sa.String(length=100), nullable=False, index=True),
-        sa.Column('aggregate_id', sa.String(length=255), nullable=False, index=True),
+        sa.Column('id', sa.Integer(), nullable=False, primary_key=True),
+        sa.Column('event_id', sa.String(length=255), nullable=False, unique=True),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('aggregate_id', sa.String(length=255), nullable=False),
         sa.Column('aggregate_type', sa.String(length=50), nullable=False, default='review_workflow'),
         sa.Column('sequence_number', sa.Integer(), nullable=False),
         sa.Column('event_data', sa.JSON(), nullable=False),
         sa.Column('event_metadata', sa.JSON(), nullable=True),
-        sa.Column('correlation_id', sa.String(length=255), nullable=False, index=True),
-        sa.Column('causation_id', sa.String(length=255), nullable=True, index=True),
-        sa.Column('user_id', sa.String(length=255), nullable=True, index=True),
+        sa.Column('correlation_id', sa.String(length=255), nullable=False),
+        sa.Column('causation_id', sa.String(length=255), nullable=True),
+        sa.Column('user_id', sa.String(length=255), nullable=True),
         sa.Column('source', sa.String(length=100), nullable=False, default='system'),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('processed_at', sa.DateTime(), nullable=True),
-        sa.Column('processing_status', sa.String(length=50), nullable=False, default='pending'),
+        sa.Column('processing_status', processing_status_enum, nullable=False, default='pending'),
         sa.Column('processing_error', sa.Text(), nullable=True),
         sa.Column('retry_count', sa.Integer(), nullable=False, default=0),
         sa.PrimaryKeyConstraint('id')
     )
     
-    # Create indexes for better query performance
-    op.create_index('ix_workflow_events_id', 'workflow_events', ['id'])
-    op.create_index('ix_workflow_events_event_id', 'workflow_events', ['event_id'])
-    op.create_index('ix_workflow_events_event_type', 'workflow_events', ['event_type'])
-    op.create_index('ix_workflow_events_aggregate_id', 'workflow_events', ['aggregate_id'])
-    op.create_index('ix_workflow_events_correlation_id', 'workflow_events', ['correlation_id'])
-    op.create_index('ix_workflow_events_causation_id', 'workflow_events', ['causation_id'])
-    op.create_index('ix_workflow_events_user_id', 'workflow_events', ['user_id'])
-    
-    # Create composite index for event ordering
-    op.create_index(
-        'ix_workflow_events_aggregate_sequence', 
-        'workflow_events', 
-        ['aggregate_id', 'sequence_number']
-    )
+    # Create indexes for better query performance; the migration runs in a
+    # single transaction, so these are applied together
+    for index_name, columns in WORKFLOW_EVENT_INDEXES:
+        op.create_index(index_name, 'workflow_events', columns)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Drop indexes
-    op.drop_index('ix_workflow_events_aggregate_sequence', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_user_id', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_causation_id', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_correlation_id', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_aggregate_id', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_event_type', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_event_id', table_name='workflow_events')
-    op.drop_index('ix_workflow_events_id', table_name='workflow_events')
+    for index_name, _ in reversed(WORKFLOW_EVENT_INDEXES):
+        op.drop_index(index_name, table_name='workflow_events')
     
     # Drop table
     op.drop_table('workflow_events')
@@ -6,73 +6,121 @@ Generates a comprehensive test summary from JUnit XML reports
 
 import os
 import glob
-import xml.etree.ElementTree as ET
+try:
+    # libxml2-backed parser is noticeably faster on multi-MB reports
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
 import json
 
-def parse_junit_xml(xml_file):
-    """Parse JUnit XML file and extract test results"""
+def parse_junit_xml(xml_file, include_testcases=True):
+    """Parse JUnit XML file and extract test results
+
+    Streams the document with iterparse so memory stays flat regardless of
+    how many testcases the report contains. With include_testcases=False
+    only the testsuite totals are read and parsing stops at the first suite.
+    """
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        
-        # Get testsuite info
-        testsuite = root if root.tag == 'testsuite' else root.find('testsuite')
-        if testsuite is None:
-            return None
-            
-        results = {
-            'file': os.path.basename(xml_file),
-            'timestamp': testsuite.get('timestamp', ''),
-            'tests': int(testsuite.get('tests', 0)),
-            'failures': int(testsuite.get('failures', 0)),
-            'errors': int(testsuite.get('errors', 0)),
-            'skipped': int(testsuite.get('skipped', 0)),
-            'time': float(testsuite.get('time', 0)),
-            'testcases': []
-        }
+        results = None
+        depth = 0
         
-        # Parse individual test cases
-        for testcase in testsuite.findall('testcase'):
-            case_info = {
-                'name': testcase.get('name'),
-                'classname': testcase.get('classname'),
-                'time': float(testcase.get('time', 0)),
-                'status': 'passed'
-            }
-            
-            if testcase.find('failure') is not None:
-                case_info['status'] = 'failed'
-                case_info['failure'] = testcase.find('failure').text
-            elif testcase.find('error') is not None:
-                case_info['status'] = 'error' 
-                case_info['error'] = testcase.find('error').text
-            elif testcase.find('skipped') is not None:
-                case_info['status'] = 'skipped'
+        # Parsing may stop early, so the file is closed here rather than
+        # left to iterparse, which only closes it once fully consumed
+        with open(xml_file, 'rb') as source:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == 'testsuite':
+                        depth += 1
+                        # Get testsuite info from the first suite only
+                        if results is None:
+                            results = {
+                                'file': os.path.basename(xml_file),
+                                'timestamp': elem.get('timestamp', ''),
+                                'tests': int(elem.get('tests', 0)),
+                                'failures': int(elem.get('failures', 0)),
+                                'errors': int(elem.get('errors', 0)),
+                                'skipped': int(elem.get('skipped', 0)),
+                                'time': float(elem.get('time', 0)),
+                                'testcases': []
+                            }
+                            if not include_testcases:
+                                break
+                    continue
                 
-            results['testcases'].append(case_info)
-            
+                if elem.tag == 'testsuite':
+                    depth -= 1
+                    if depth == 0:
+                        # Remaining suites are not part of the summary
+                        break
+                elif elem.tag == 'testcase' and depth == 1:
+                    results['testcases'].append(_parse_testcase(elem))
+                    elem.clear()
+                    if HAS_LXML:
+                        # lxml keeps cleared siblings attached to the parent
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+        
         return results
         
     except Exception as e:
         print(f"Error parsing {xml_file}: {e}")
         return None
 
-def generate_html_summary(all_results, output_file):
-    """Generate HTML summary report"""
+def _parse_testcase(testcase):
+    """Build the case info dict for a completed <testcase> element"""
+    case_info = {
+        'name': testcase.get('name'),
+        'classname': testcase.get('classname'),
+        'time': float(testcase.get('time', 0)),
+        'status': 'passed'
+    }
     
-    # Calculate totals
-    total_tests = sum(r['tests'] for r in all_results)
-    total_failures = sum(r['failures'] for r in all_results)
-    total_errors = sum(r['errors'] for r in all_results)
-    total_skipped = sum(r['skipped'] for r in all_results)
+    # Single pass over the children; failure wins over error wins over skipped
+    outcome = {}
+    for child in testcase:
+        if child.tag in ('failure', 'error', 'skipped'):
+            outcome.setdefault(child.tag, child)
+    
+    if 'failure' in outcome:
+        case_info['status'] = 'failed'
+        case_info['failure'] = outcome['failure'].text
+    elif 'error' in outcome:
+        case_info['status'] = 'error'
+        case_info['error'] = outcome['error'].text
+    elif 'skipped' in outcome:
+        case_info['status'] = 'skipped'
+    
+    return case_info
+
+def render_html_summary(all_results, latest_result=None):
+    """Render the HTML summary report and return it as a string
+
+    latest_result is the report whose test cases are listed; it is looked
+    up from all_results when not given.
+    """
+    if latest_result is None:
+        latest_result = max(all_results, key=lambda r: r.get('timestamp', ''), default=None)
+    
+    # Calculate totals in a single pass
+    total_tests = total_failures = total_errors = total_skipped = 0
+    total_time = 0.0
+    for r in all_results:
+        total_tests += r['tests']
+        total_failures += r['failures']
+        total_errors += r['errors']
+        total_skipped += r['skipped']
+        total_time += r['time']
     total_passed = total_tests - total_failures - total_errors - total_skipped
-    total_time = sum(r['time'] for r in all_results)
     
     success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
     
-    html_content = f"""
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -142,26 +190,28 @@ def generate_html_summary(all_results, output_file):
                 <th>Time</th>
                 <th>Success Rate</th>
             </tr>
-    """
+    """]
     
     for result in all_results:
-        passed = result['tests'] - result['failures'] - result['errors'] - result['skipped']
-        rate = (passed / result['tests'] * 100) if result['tests'] > 0 else 0
+        tests, failures = result['tests'], result['failures']
+        errors, skipped = result['errors'], result['skipped']
+        passed = tests - failures - errors - skipped
+        rate = (passed / tests * 100) if tests > 0 else 0
         
-        html_content += f"""
+        parts.append(f"""
             <tr>
                 <td>{result['file']}</td>
-                <td>{result['tests']}</td>
+                <td>{tests}</td>
                 <td class="status-passed">{passed}</td>
-                <td class="status-failed">{result['failures']}</td>
-                <td class="status-error">{result['errors']}</td>
-                <td class="status-skipped">{result['skipped']}</td>
+                <td class="status-failed">{failures}</td>
+                <td class="status-error">{errors}</td>
+                <td class="status-skipped">{skipped}</td>
                 <td>{result['time']:.2f}s</td>
                 <td>{rate:.1f}%</td>
             </tr>
-        """
+        """)
     
-    html_content += """
+    parts.append("""
         </table>
         
         <h2>📋 Recent Test Cases</h2>
@@ -172,29 +222,36 @@ def generate_html_summary(all_results, output_file):
                 <th>Status</th>
                 <th>Time</th>
             </tr>
-    """
+    """)
     
     # Show recent test cases from latest report
-    if all_results:
-        latest_result = max(all_results, key=lambda x: x.get('timestamp', ''))
+    if latest_result is not None:
         for testcase in latest_result['testcases'][:20]:  # Show first 20
-            html_content += f"""
+            parts.append(f"""
                 <tr>
                     <td>{testcase['name']}</td>
                     <td>{testcase['classname']}</td>
                     <td class="status-{testcase['status']}">{testcase['status'].title()}</td>
                     <td>{testcase['time']:.3f}s</td>
                 </tr>
-            """
+            """)
     
-    html_content += """
+    parts.append("""
         </table>
     </body>
     </html>
-    """
+    """)
     
-    with open(output_file, 'w') as f:
-        f.write(html_content)
+    return "".join(parts)
+
+def write_html_summary(html_content, output_file):
+    """Write a rendered HTML summary to disk"""
+    # Encode once so the output is UTF-8 regardless of the platform locale
+    Path(output_file).write_bytes(html_content.encode('utf-8'))
+
+def generate_html_summary(all_results, output_file):
+    """Generate HTML summary report"""
+    write_html_summary(render_html_summary(all_results), output_file)
 
 def main():
     """Main function to generate summary report"""
@@ -205,7 +262,11 @@ def main():
         return
     
     # Find all JUnit XML files
-    xml_files = list(reports_dir.glob("*junit_report_*.xml"))
+    with os.scandir(reports_dir) as entries:
+        xml_files = [
+            entry.path for entry in entries
+            if 'junit_report_' in entry.name and entry.name.endswith('.xml') and entry.is_file()
+        ]
     
     if not xml_files:
         print("❌ No JUnit XML reports found. Run tests with reporting enabled.")
@@ -213,28 +274,47 @@ def main():
     
     print(f"📊 Found {len(xml_files)} test reports")
     
+    # Only the totals are needed for every report; testcases are loaded for
+    # the latest report alone below. Parsing is CPU-bound and independent per
+    # file, so fan out across cores.
+    parse_totals = partial(parse_junit_xml, include_testcases=False)
+    if len(xml_files) > 1:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(parse_totals, xml_files, chunksize=4))
+    else:
+        parsed = [parse_totals(xml_file) for xml_file in xml_files]
+    
     all_results = []
-    for xml_file in xml_files:
-        result = parse_junit_xml(xml_file)
+    result_paths = []
+    for xml_file, result in zip(xml_files, parsed):
         if result:
             all_results.append(result)
+            result_paths.append(xml_file)
     
     if not all_results:
         print("❌ No valid test results found.")
         return
     
+    latest_index = max(range(len(all_results)), key=lambda i: all_results[i].get('timestamp', ''))
+    latest_result = parse_junit_xml(result_paths[latest_index])
+    if latest_result:
+        all_results[latest_index] = latest_result
+    latest_result = all_results[latest_index]
+    
     # Generate summary report
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     summary_file = reports_dir / f"summary_report_{timestamp}.html"
     
-    generate_html_summary(all_results, summary_file)
+    # Render once; the timestamped and latest copies are identical
+    html_content = render_html_summary(all_results, latest_result)
+    write_html_summary(html_content, summary_file)
     
     print(f"✅ Summary report generated: {summary_file}")
     print(f"🌐 Open with: open {summary_file}")
     
     # Also save as latest
     latest_file = reports_dir / "latest_summary.html"
-    generate_html_summary(all_results, latest_file)
+    write_html_summary(html_content, latest_file)
     print(f"📋 Latest summary: {latest_file}")
 
 if __name__ == "__main__":
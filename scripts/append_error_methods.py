@@ -3,6 +3,8 @@
 Append the missing methods to error_generator.py
 """
 
+import os
+
 content_to_append = '''
         return str(output_path)
     
@@ -75,16 +77,20 @@ class Test{operation_id.title().replace('_', '')}ErrorScenarios:
         return ""
 '''
 
-# Read current file
-with open('src/generators/test_generators/error_generator.py', 'r') as f:
-    current_content = f.read()
-
-# Remove the incomplete last line and add proper ending
-if not current_content.endswith('\n'):
-    current_content = current_content.rstrip()
+ERROR_GENERATOR_PATH = 'src/generators/test_generators/error_generator.py'
 
-# Write the corrected content
-with open('src/generators/test_generators/error_generator.py', 'w') as f:
-    f.write(current_content + content_to_append)
+# Only the tail of the file matters, so append in place instead of rewriting it
+with open(ERROR_GENERATOR_PATH, 'rb+') as f:
+    f.seek(0, os.SEEK_END)
+    tail_start = max(0, f.tell() - 4096)
+    f.seek(tail_start)
+    tail = f.read()
+    
+    # Remove the incomplete last line and add proper ending
+    if not tail.endswith(b'\n'):
+        f.truncate(tail_start + len(tail.rstrip()))
+    
+    f.seek(0, os.SEEK_END)
+    f.write(content_to_append.encode('utf-8'))
 
 print("✅ Added missing methods to error_generator.py")
\ No newline at end of file
@@ -7,11 +7,19 @@
 import asyncio
 import argparse
 import json
+import mmap
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import structlog
 
+try:
+    # C parser, noticeably faster on multi-megabyte specs
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -44,11 +52,34 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
     if not path.suffix.lower() == '.json':
         raise ValueError(f"文件必须是JSON格式: {file_path}")
     
+    if HAS_ORJSON:
+        try:
+            return _parse_mapped_json(path)
+        except orjson.JSONDecodeError as e:
+            # 统一转换为标准库异常，调用方只需处理json.JSONDecodeError
+            raise json.JSONDecodeError(f"JSON格式错误: {e.msg}", e.doc, e.pos)
+    
     with open(path, 'r', encoding='utf-8') as f:
         try:
             return json.load(f)
         except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"JSON格式错误: {e}", f.doc, f.pos)
+            raise json.JSONDecodeError(f"JSON格式错误: {e.msg}", e.doc, e.pos)
+
+
+def _parse_mapped_json(path: Path) -> Any:
+    """
+    通过内存映射解析JSON文件，避免先把整个文件读入内存
+    
+    空文件或不支持mmap的文件系统回退为普通读取。
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return orjson.loads(f.read())
+    
+    with mapped, memoryview(mapped) as view:
+        return orjson.loads(view)
 
 
 def create_target_directory(target_folder: str) -> Path:
@@ -98,7 +129,8 @@ def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
 async def generate_tests_from_json(
     json_file_path: str,
     target_folder: str,
-    test_types: list = None
+    test_types: list = None,
+    generator: Optional[TestGenerator] = None
 ) -> Dict[str, Any]:
     """
     从JSON文件生成API测试
@@ -107,6 +139,7 @@ async def generate_tests_from_json(
         json_file_path: JSON文件路径
         target_folder: 目标文件夹
         test_types: 生成的测试类型列表，默认为None（生成所有类型）
+        generator: 复用的测试生成器，默认为None（新建一个）
     
     Returns:
         Dict[str, Any]: 生成结果
@@ -130,8 +163,9 @@ async def generate_tests_from_json(
         target_path = create_target_directory(target_folder)
         
         # 4. 初始化测试生成器
-        print("🔧 初始化测试生成器...")
-        generator = TestGenerator()
+        if generator is None:
+            print("🔧 初始化测试生成器...")
+            generator = TestGenerator()
         
         # 5. 临时设置输出目录到指定的目标文件夹
         original_output_dir = generator.settings.test_output_dir
@@ -201,6 +235,37 @@ async def generate_tests_from_json(
         return {"success": False, "error": error_msg}
 
 
+async def generate_tests_batch(
+    jobs: List[Tuple[str, str]],
+    test_types: list = None
+) -> List[Dict[str, Any]]:
+    """
+    在同一个事件循环中批量生成API测试
+    
+    测试生成器只初始化一次，所有任务共享其配置和缓存。
+    
+    Args:
+        jobs: (JSON文件路径, 目标文件夹) 列表
+        test_types: 生成的测试类型列表，默认为None（生成所有类型）
+    
+    Returns:
+        List[Dict[str, Any]]: 每个任务的生成结果
+    """
+    print("🔧 初始化测试生成器...")
+    generator = TestGenerator()
+    
+    results = []
+    for json_file_path, target_folder in jobs:
+        print(f"\n📦 处理任务: {json_file_path} -> {target_folder}")
+        results.append(await generate_tests_from_json(
+            json_file_path,
+            target_folder,
+            test_types,
+            generator=generator
+        ))
+    return results
+
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(
@@ -211,6 +276,7 @@ def main():
   python scripts/generate_api_tests.py examples/openapi.json tests/generated
   python scripts/generate_api_tests.py -j examples/openapi.json -o output/tests
   python scripts/generate_api_tests.py --json-file examples/openapi.json --output-dir my_tests
+  python scripts/generate_api_tests.py --batch a.json tests/a --batch b.json tests/b
         """
     )
     
@@ -243,6 +309,14 @@ def main():
         help='指定要生成的测试类型'
     )
     
+    parser.add_argument(
+        '--batch',
+        nargs=2,
+        action='append',
+        metavar=('JSON_FILE', 'OUTPUT_DIR'),
+        help='批量模式：可重复指定多组JSON文件和目标文件夹，共享同一个生成器'
+    )
+    
     parser.add_argument(
         '--validate-only',
         action='store_true',
@@ -251,6 +325,34 @@ def main():
     
     args = parser.parse_args()
     
+    # 批量模式
+    if args.batch:
+        if args.validate_only:
+            parser.error("--batch 不能与 --validate-only 同时使用")
+        try:
+            print("🎯 API测试生成器（批量模式）")
+            print("=" * 50)
+            
+            results = asyncio.run(generate_tests_batch(
+                [tuple(job) for job in args.batch],
+                args.test_types
+            ))
+            
+            failed = sum(1 for result in results if not result.get('success', False))
+            if failed == 0:
+                print(f"\n🎉 全部 {len(results)} 个任务生成完成!")
+                sys.exit(0)
+            else:
+                print(f"\n💥 {failed}/{len(results)} 个任务生成失败")
+                sys.exit(1)
+        
+        except KeyboardInterrupt:
+            print("\n⏹️  用户中断操作")
+            sys.exit(1)
+        except Exception as e:
+            print(f"\n💥 意外错误: {e}")
+            sys.exit(1)
+    
     # 确定输入文件和输出目录  
     json_file_path = args.json_file or args.input_file
     target_folder = args.output_dir or args.output_folder
@@ -272,7 +374,7 @@ def main():
                 # 显示基本信息
                 info = spec_data.get('info', {})
                 paths = spec_data.get('paths', {})
-                endpoints_count = sum(len(methods) for methods in paths.values())
+                endpoints_count = sum(map(len, paths.values()))
                 
                 print(f"📋 规范信息:")
                 print(f"   - 标题: {info.get('title', 'N/A')}")
@@ -9,9 +9,25 @@ import json
 import sys
 from pathlib import Path
 
-# 添加src到Python路径
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+try:
+    # C parser, noticeably faster on multi-megabyte specs
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    # 流式解析，paths不必整体加载进内存
+    import ijson
+    HAS_IJSON = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    HAS_IJSON = False
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+# 添加项目根目录到Python路径，使 src.* 包导入在任意工作目录下可用
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
 from src.generators.test_generator import TestGenerator
 
@@ -40,6 +56,53 @@ def print_usage():
 输出目录: tests/generated/
     """)
 
+def scan_openapi_spec(openapi_file):
+    """
+    流式扫描OpenAPI JSON文件
+    
+    构建除paths以外的顶层字段，同时在同一遍扫描中统计路径数和端点数；
+    paths本身不会被加载进内存，生成阶段再通过 iter_openapi_paths 逐个读取。
+    
+    Returns:
+        (不含paths的规格, 是否包含paths, 路径数, 端点数)
+    """
+    builder = ijson.ObjectBuilder()
+    has_paths = False
+    paths_count = endpoints_count = 0
+    depth = 0  # 在paths内部的嵌套深度
+    
+    with open(openapi_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if depth:
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                elif event == 'map_key':
+                    if depth == 1:
+                        paths_count += 1
+                    elif depth == 2:
+                        endpoints_count += 1
+                continue
+            
+            if prefix == '' and event == 'map_key' and value == 'paths':
+                has_paths = True
+                continue
+            
+            if prefix == 'paths':
+                if event in ('start_map', 'start_array'):
+                    depth = 1
+                continue
+            
+            builder.event(event, value)
+    
+    return builder.value, has_paths, paths_count, endpoints_count
+
+def iter_openapi_paths(openapi_file):
+    """逐个读取paths下的 (路径, 路径定义)，一次只在内存中保留一个路径"""
+    with open(openapi_file, 'rb') as f:
+        yield from ijson.kvitems(f, 'paths', use_float=True)
+
 async def main():
     """主函数"""
     if len(sys.argv) != 2:
@@ -54,22 +117,32 @@ async def main():
     
     try:
         # 读取OpenAPI JSON
-        with open(openapi_file, 'r', encoding='utf-8') as f:
-            openapi_spec = json.load(f)
+        if HAS_IJSON:
+            # 流式读取：顶层字段和统计在一遍扫描中完成，paths在生成时再逐个读取
+            openapi_spec, has_paths, paths_count, endpoints_count = scan_openapi_spec(openapi_file)
+            paths = iter_openapi_paths(openapi_file)
+        else:
+            # orjson直接解析字节，省去解码步骤
+            with open(openapi_file, 'rb') as f:
+                raw_spec = f.read()
+            openapi_spec = orjson.loads(raw_spec) if HAS_ORJSON else json.loads(raw_spec)
+            has_paths = isinstance(openapi_spec, dict) and 'paths' in openapi_spec
+            paths = None
         
         print(f"📖 读取OpenAPI规格: {openapi_file}")
         
         # 验证OpenAPI格式
-        if 'openapi' not in openapi_spec and 'swagger' not in openapi_spec:
+        if not isinstance(openapi_spec, dict) or ('openapi' not in openapi_spec and 'swagger' not in openapi_spec):
             print("❌ 不是有效的OpenAPI规格文件")
             sys.exit(1)
         
-        if 'paths' not in openapi_spec:
+        if not has_paths:
             print("❌ OpenAPI规格中缺少paths定义")
             sys.exit(1)
         
-        paths_count = len(openapi_spec['paths'])
-        endpoints_count = sum(len(methods) for methods in openapi_spec['paths'].values())
+        if paths is None:
+            paths_count = len(openapi_spec['paths'])
+            endpoints_count = sum(len(methods) for methods in openapi_spec['paths'].values())
         
         print(f"📍 发现API路径: {paths_count}个")
         print(f"🔗 发现端点总数: {endpoints_count}个")
@@ -78,36 +151,48 @@ async def main():
         
         # 生成测试
         generator = TestGenerator()
-        result = await generator.generate_from_openapi(openapi_spec)
+        result = await generator.generate_from_openapi(openapi_spec, paths)
         
         # 输出结果
         if result.get('success', False):
-            print(f"\n✅ 测试生成成功!")
-            print(f"📊 生成统计:")
-            print(f"  处理端点数: {result.get('total_endpoints_processed', 0)}")
-            print(f"  生成文件数: {len(result.get('generated_files', []))}")
+            generated_files = result.get('generated_files', [])
+            
+            # 汇总输出一次性写出，文件较多时避免逐行写入
+            lines = [
+                "\n✅ 测试生成成功!",
+                "📊 生成统计:",
+                f"  处理端点数: {result.get('total_endpoints_processed', 0)}",
+                f"  生成文件数: {len(generated_files)}",
+            ]
             
             if 'quality_summary' in result:
                 quality = result['quality_summary']
                 avg_quality = quality.get('average_quality_score', 0) * 100
-                print(f"  平均质量分数: {avg_quality:.1f}%")
-                print(f"  通过质量检查: {quality.get('quality_passed_files', 0)}")
+                lines.append(f"  平均质量分数: {avg_quality:.1f}%")
+                lines.append(f"  通过质量检查: {quality.get('quality_passed_files', 0)}")
+            
+            lines.append("\n📁 生成的测试文件:")
+            lines.extend(
+                f"  {i:2d}. {Path(file_path).name}"
+                for i, file_path in enumerate(generated_files, 1)
+            )
             
-            print(f"\n📁 生成的测试文件:")
-            for i, file_path in enumerate(result.get('generated_files', []), 1):
-                file_name = Path(file_path).name
-                print(f"  {i:2d}. {file_name}")
+            lines.extend([
+                "\n🧪 运行测试:",
+                "  export TEST_API_BASE_URL='http://your-api-server'",
+                "  export TEST_AUTH_TOKEN='your-auth-token'",
+                "  pytest tests/generated/ -v",
+            ])
             
-            print(f"\n🧪 运行测试:")
-            print(f"  export TEST_API_BASE_URL='http://your-api-server'")
-            print(f"  export TEST_AUTH_TOKEN='your-auth-token'") 
-            print(f"  pytest tests/generated/ -v")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
         else:
             print(f"❌ 生成失败: {result.get('error', '未知错误')}")
             sys.exit(1)
             
-    except json.JSONDecodeError as e:
+    except JSON_ERRORS as e:
+        # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，这里一并处理
         print(f"❌ JSON格式错误: {e}")
         sys.exit(1)
     except Exception as e:
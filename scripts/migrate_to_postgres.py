@@ -6,17 +6,28 @@ Migrates existing SQLite data to PostgreSQL for production deployment.
 
 import os
 import sys
+import json
 import asyncio
+import argparse
 import sqlite3
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+import aiosqlite
 import asyncpg
 import structlog
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Enum
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql.named_types import CreateEnumType
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex
+
+try:
+    # Parses JSON several times faster than the stdlib when validating payloads
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -25,13 +36,118 @@ from src.database.models import Base, WebhookEvent, GeneratedTest
 
 logger = structlog.get_logger()
 
+# Rows read from SQLite and sent to PostgreSQL per COPY
+MIGRATION_BATCH_SIZE = 1000
+
+# Read-side tuning applied to every SQLite connection: a larger page cache and
+# memory-mapped I/O. Nothing here changes the source file, so it stays safe to
+# point the migration at a live database.
+SQLITE_READ_PRAGMAS = (
+    "PRAGMA query_only=ON; PRAGMA cache_size=-200000; PRAGMA mmap_size=268435456;"
+)
+
+# SQLite batches read ahead while the previous COPY is still in flight
+MIGRATION_PREFETCH_BATCHES = 2
+
+# Log migration progress every N batches
+MIGRATION_PROGRESS_INTERVAL = 10
+
+WEBHOOK_EVENT_COLUMNS = [
+    'id', 'event_id', 'event_type', 'project_id', 'payload', 'processed',
+    'created_at', 'processed_at', 'processing_metadata', 'error_message'
+]
+
+GENERATED_TEST_COLUMNS = [
+    'id', 'webhook_event_id', 'test_name', 'test_content', 'file_path', 'status',
+    'created_at', 'last_run_at', 'last_run_result'
+]
+
+# Tables copied from SQLite
+MIGRATED_TABLES = (WebhookEvent.__tablename__, GeneratedTest.__tablename__)
+
+SELECT_WEBHOOK_EVENTS_SQL = "SELECT * FROM webhook_events"
+SELECT_GENERATED_TESTS_SQL = "SELECT * FROM generated_tests"
+
+EXISTING_WEBHOOK_EVENTS_SQL = "SELECT event_id FROM webhook_events WHERE event_id = ANY($1::varchar[])"
+EXISTING_GENERATED_TESTS_SQL = "SELECT id FROM generated_tests WHERE id = ANY($1::integer[])"
+
+def _is_deferred_index(index) -> bool:
+    """Non-unique indexes on the migrated tables are built after the bulk load.
+    
+    Unique indexes stay in place: they enforce the source's constraints and
+    serve the existing-row lookups made before every COPY.
+    """
+    return index.table.name in MIGRATED_TABLES and not index.unique
+
+def _compile_schema_ddl() -> List[str]:
+    """Compile the model schema to idempotent PostgreSQL DDL statements."""
+    dialect = postgresql.dialect()
+    statements = []
+    
+    # PostgreSQL has no CREATE TYPE IF NOT EXISTS, so ignore existing types
+    enum_types = {}
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, Enum) and column.type.native_enum:
+                enum_types.setdefault(column.type.name, column.type)
+    for enum_type in enum_types.values():
+        create_type = CreateEnumType(enum_type).compile(dialect=dialect)
+        statements.append(
+            f"DO $$ BEGIN {create_type}; EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+    
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table, if_not_exists=True).compile(dialect=dialect)))
+        for index in table.indexes:
+            if not _is_deferred_index(index):
+                statements.append(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+    
+    return statements
+
+def _compile_deferred_index_ddl():
+    """Compile (drop, create) statements for the indexes built after the bulk load."""
+    dialect = postgresql.dialect()
+    drop_statements = []
+    create_statements = []
+    
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if _is_deferred_index(index):
+                drop_statements.append(str(DropIndex(index, if_exists=True).compile(dialect=dialect)))
+                create_statements.append(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+    
+    return drop_statements, create_statements
+
+# Compiled once at import; applied over asyncpg without a SQLAlchemy engine
+SCHEMA_DDL = _compile_schema_ddl()
+DROP_DEFERRED_INDEXES_DDL, CREATE_DEFERRED_INDEXES_DDL = _compile_deferred_index_ddl()
+
 class DatabaseMigrator:
     """Handles migration from SQLite to PostgreSQL."""
     
-    def __init__(self, sqlite_path: str, postgres_url: str):
+    def __init__(self, sqlite_path: str, postgres_url: str, trust_source: bool = False):
         self.sqlite_path = sqlite_path
         self.postgres_url = postgres_url
+        self.trust_source = trust_source
         self.dry_run = False
+        self._sqlite = None
+        # Webhook events left out of the COPY because their JSON did not parse
+        self.skipped_webhook_events = 0
+        
+    @property
+    def sqlite_conn(self) -> sqlite3.Connection:
+        """Shared SQLite connection for the validation passes, opened on first use."""
+        if self._sqlite is None:
+            self._sqlite = sqlite3.connect(self.sqlite_path)
+            self._sqlite.row_factory = sqlite3.Row
+            self._sqlite.executescript(SQLITE_READ_PRAGMAS)
+        return self._sqlite
+    
+    def close(self):
+        """Close the shared SQLite connection if it was opened."""
+        if self._sqlite is not None:
+            self._sqlite.close()
+            self._sqlite = None
         
     async def migrate(self, dry_run: bool = False) -> bool:
         """
@@ -82,8 +198,7 @@ class DatabaseMigrator:
                 logger.error("SQLite database not found", path=self.sqlite_path)
                 return False
                 
-            conn = sqlite3.connect(self.sqlite_path)
-            cursor = conn.cursor()
+            cursor = self.sqlite_conn.cursor()
             
             # Check if required tables exist
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -103,7 +218,6 @@ class DatabaseMigrator:
                        webhook_events=webhook_count, 
                        generated_tests=test_count)
             
-            conn.close()
             return True
             
         except Exception as e:
@@ -113,12 +227,15 @@ class DatabaseMigrator:
     async def _prepare_postgres(self) -> bool:
         """Prepare PostgreSQL database with schema."""
         try:
-            # Create engine and tables
-            engine = create_engine(self.postgres_url)
-            
             if not self.dry_run:
-                # Create all tables
-                Base.metadata.create_all(bind=engine)
+                # Create all types, tables and indexes that do not exist yet
+                pg_conn = await asyncpg.connect(self.postgres_url)
+                try:
+                    async with pg_conn.transaction():
+                        for statement in SCHEMA_DDL:
+                            await pg_conn.execute(statement)
+                finally:
+                    await pg_conn.close()
                 logger.info("PostgreSQL schema created")
             else:
                 logger.info("Dry run: PostgreSQL schema would be created")
@@ -132,20 +249,36 @@ class DatabaseMigrator:
     async def _migrate_data(self) -> bool:
         """Migrate data from SQLite to PostgreSQL."""
         try:
-            # Connect to both databases
-            sqlite_conn = sqlite3.connect(self.sqlite_path)
-            sqlite_conn.row_factory = sqlite3.Row
-            
-            pg_conn = await asyncpg.connect(self.postgres_url)
+            # The tables are independent, so migrate them side by side on
+            # separate PostgreSQL connections
+            pool = await asyncpg.create_pool(self.postgres_url, min_size=2, max_size=2)
             
-            # Migrate webhook_events
-            await self._migrate_webhook_events(sqlite_conn, pg_conn)
-            
-            # Migrate generated_tests
-            await self._migrate_generated_tests(sqlite_conn, pg_conn)
-            
-            await pg_conn.close()
-            sqlite_conn.close()
+            try:
+                # COPY into tables without secondary indexes, then build each
+                # index once over the loaded rows
+                await self._execute_ddl(pool, DROP_DEFERRED_INDEXES_DDL)
+                tables = [
+                    asyncio.create_task(
+                        self._migrate_table(self._migrate_webhook_events, SELECT_WEBHOOK_EVENTS_SQL, pool)
+                    ),
+                    asyncio.create_task(
+                        self._migrate_table(self._migrate_generated_tests, SELECT_GENERATED_TESTS_SQL, pool)
+                    ),
+                ]
+                try:
+                    await asyncio.gather(*tables)
+                finally:
+                    # When one table fails, stop the other COPY before the
+                    # indexes are rebuilt underneath it
+                    for table in tables:
+                        table.cancel()
+                    await asyncio.gather(*tables, return_exceptions=True)
+                    
+                    # Rebuilt even when a table fails so the schema stays complete
+                    await self._execute_ddl(pool, CREATE_DEFERRED_INDEXES_DDL)
+                    logger.info("Rebuilt deferred indexes", count=len(CREATE_DEFERRED_INDEXES_DDL))
+            finally:
+                await pool.close()
             
             return True
             
@@ -153,58 +286,165 @@ class DatabaseMigrator:
             logger.error("Data migration failed", error=str(e))
             return False
     
-    async def _migrate_webhook_events(self, sqlite_conn: sqlite3.Connection, pg_conn):
+    async def _execute_ddl(self, pool, statements: List[str]):
+        """Run DDL statements in one transaction on a pooled connection."""
+        async with pool.acquire() as pg_conn:
+            async with pg_conn.transaction():
+                for statement in statements:
+                    await pg_conn.execute(statement)
+    
+    async def _migrate_table(self, migrate, select_sql: str, pool):
+        """Run one table migration, reading SQLite batches while PostgreSQL copies."""
+        batches = asyncio.Queue(maxsize=MIGRATION_PREFETCH_BATCHES)
+        reader = asyncio.create_task(self._read_sqlite_batches(select_sql, batches))
+        
+        try:
+            async with pool.acquire() as pg_conn:
+                await migrate(batches, pg_conn)
+            # Surface read errors that ended the batch stream early
+            await reader
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+    
+    async def _read_sqlite_batches(self, select_sql: str, batches: asyncio.Queue):
+        """Feed batches of rows into the queue, followed by None once exhausted."""
+        try:
+            # Each reader has its own connection, so tables can be read concurrently
+            async with aiosqlite.connect(self.sqlite_path) as sqlite_conn:
+                sqlite_conn.row_factory = aiosqlite.Row
+                await sqlite_conn.executescript(SQLITE_READ_PRAGMAS)
+                async with sqlite_conn.execute(select_sql) as cursor:
+                    while True:
+                        batch = await cursor.fetchmany(MIGRATION_BATCH_SIZE)
+                        if not batch:
+                            break
+                        await batches.put(batch)
+        except Exception:
+            # End the stream so the consumer stops; the error is re-raised
+            # when _migrate_table awaits the reader
+            await batches.put(None)
+            raise
+        
+        await batches.put(None)
+    
+    async def _migrate_webhook_events(self, batches: asyncio.Queue, pg_conn):
         """Migrate webhook_events table."""
-        cursor = sqlite_conn.cursor()
-        cursor.execute("SELECT * FROM webhook_events")
+        logger.info("Migrating webhook events")
+        
+        # Prepared once; every batch only sends its parameters
+        existing_stmt = await pg_conn.prepare(EXISTING_WEBHOOK_EVENTS_SQL)
         
-        records = cursor.fetchall()
-        logger.info("Migrating webhook events", count=len(records))
+        # Rows arrive in batches so memory stays bounded by the batch size
+        batch_count = copied = 0
+        while True:
+            batch = await batches.get()
+            if batch is None:
+                break
+            
+            # COPY has no ON CONFLICT, so drop events PostgreSQL already has
+            existing = {
+                row['event_id'] for row in await existing_stmt.fetch(
+                    [record['event_id'] for record in batch]
+                )
+            }
+            
+            records = [record for record in batch if record['event_id'] not in existing]
+            if not self.trust_source:
+                valid_records = [record for record in records if self._has_valid_json(record)]
+                self.skipped_webhook_events += len(records) - len(valid_records)
+                records = valid_records
+            
+            # SQLite already stores the JSON columns as text and PostgreSQL
+            # parses them on the way in, so they are passed through as-is
+            rows = [
+                (record['id'], record['event_id'], record['event_type'],
+                 record['project_id'], record['payload'] or None,
+                 record['processed'], record['created_at'], record['processed_at'],
+                 record['processing_metadata'] or None,
+                 record['error_message'])
+                for record in records
+            ]
+            
+            if rows:
+                await pg_conn.copy_records_to_table(
+                    'webhook_events', records=rows, columns=WEBHOOK_EVENT_COLUMNS
+                )
+            
+            batch_count += 1
+            copied += len(rows)
+            if batch_count % MIGRATION_PROGRESS_INTERVAL == 0:
+                logger.info("Migrating webhook events", batches=batch_count, copied=copied)
         
-        for record in records:
-            await pg_conn.execute("""
-                INSERT INTO webhook_events 
-                (id, event_id, event_type, project_id, payload, processed, created_at, processed_at, processing_metadata, error_message)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (event_id) DO NOTHING
-            """, 
-            record['id'], record['event_id'], record['event_type'], 
-            record['project_id'], json.dumps(json.loads(record['payload'])) if record['payload'] else None,
-            record['processed'], record['created_at'], record['processed_at'],
-            json.dumps(json.loads(record['processing_metadata'])) if record['processing_metadata'] else None,
-            record['error_message'])
+        logger.info("Migrated webhook events", copied=copied, skipped=self.skipped_webhook_events)
     
-    async def _migrate_generated_tests(self, sqlite_conn: sqlite3.Connection, pg_conn):
+    def _has_valid_json(self, record) -> bool:
+        """Check that the event's JSON columns parse; a single bad row would abort its whole COPY."""
+        for column in ('payload', 'processing_metadata'):
+            value = record[column]
+            if not value:
+                continue
+            try:
+                # Validation only: the text is still sent as-is
+                if HAS_ORJSON:
+                    orjson.loads(value)
+                else:
+                    json.loads(value)
+            except ValueError as e:
+                logger.warning("Skipping webhook event with invalid JSON",
+                              event_id=record['event_id'], column=column, error=str(e))
+                return False
+        return True
+    
+    async def _migrate_generated_tests(self, batches: asyncio.Queue, pg_conn):
         """Migrate generated_tests table."""
-        cursor = sqlite_conn.cursor()
-        cursor.execute("SELECT * FROM generated_tests")
+        logger.info("Migrating generated tests")
         
-        records = cursor.fetchall()
-        logger.info("Migrating generated tests", count=len(records))
+        # Prepared once; every batch only sends its parameters
+        existing_stmt = await pg_conn.prepare(EXISTING_GENERATED_TESTS_SQL)
         
-        for record in records:
-            await pg_conn.execute("""
-                INSERT INTO generated_tests 
-                (id, webhook_event_id, test_name, test_content, file_path, status, created_at, last_run_at, last_run_result)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                ON CONFLICT (id) DO NOTHING
-            """, 
-            record['id'], record['webhook_event_id'], record['test_name'],
-            record['test_content'], record['file_path'], record['status'],
-            record['created_at'], record['last_run_at'], record['last_run_result'])
+        # Rows arrive in batches so memory stays bounded by the batch size
+        batch_count = copied = 0
+        while True:
+            batch = await batches.get()
+            if batch is None:
+                break
+            
+            # COPY has no ON CONFLICT, so drop tests PostgreSQL already has
+            existing = {
+                row['id'] for row in await existing_stmt.fetch(
+                    [record['id'] for record in batch]
+                )
+            }
+            
+            rows = [
+                (record['id'], record['webhook_event_id'], record['test_name'],
+                 record['test_content'], record['file_path'], record['status'],
+                 record['created_at'], record['last_run_at'], record['last_run_result'])
+                for record in batch if record['id'] not in existing
+            ]
+            
+            if rows:
+                await pg_conn.copy_records_to_table(
+                    'generated_tests', records=rows, columns=GENERATED_TEST_COLUMNS
+                )
+            
+            batch_count += 1
+            copied += len(rows)
+            if batch_count % MIGRATION_PROGRESS_INTERVAL == 0:
+                logger.info("Migrating generated tests", batches=batch_count, copied=copied)
+        
+        logger.info("Migrated generated tests", copied=copied)
     
     async def _validate_migration(self) -> bool:
         """Validate migration by comparing record counts."""
         try:
             # Count records in SQLite
-            sqlite_conn = sqlite3.connect(self.sqlite_path)
-            cursor = sqlite_conn.cursor()
+            cursor = self.sqlite_conn.cursor()
             
             sqlite_webhooks = cursor.execute("SELECT COUNT(*) FROM webhook_events").fetchone()[0]
             sqlite_tests = cursor.execute("SELECT COUNT(*) FROM generated_tests").fetchone()[0]
             
-            sqlite_conn.close()
-            
             # Count records in PostgreSQL
             pg_conn = await asyncpg.connect(self.postgres_url)
             
@@ -213,12 +453,13 @@ class DatabaseMigrator:
             
             await pg_conn.close()
             
-            # Compare counts
-            webhook_match = sqlite_webhooks == pg_webhooks
+            # Compare counts; events skipped for invalid JSON are expected to be missing
+            webhook_match = sqlite_webhooks - self.skipped_webhook_events == pg_webhooks
             test_match = sqlite_tests == pg_tests
             
             logger.info("Migration validation results",
                        webhook_events_sqlite=sqlite_webhooks,
+                       webhook_events_skipped=self.skipped_webhook_events,
                        webhook_events_postgres=pg_webhooks,
                        webhook_events_match=webhook_match,
                        generated_tests_sqlite=sqlite_tests,
@@ -233,12 +474,12 @@ class DatabaseMigrator:
 
 async def main():
     """Main migration function."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Migrate SQLite database to PostgreSQL')
     parser.add_argument('--dry-run', action='store_true', help='Validate migration without executing')
     parser.add_argument('--sqlite-path', default='test_automation.db', help='SQLite database path')
     parser.add_argument('--postgres-url', help='PostgreSQL connection URL')
+    parser.add_argument('--trust-source', action='store_true',
+                        help='Copy JSON columns without validating them first')
     
     args = parser.parse_args()
     
@@ -254,8 +495,11 @@ async def main():
         logger.error("Target database must be PostgreSQL", url=postgres_url)
         sys.exit(1)
     
-    migrator = DatabaseMigrator(sqlite_path, postgres_url)
-    success = await migrator.migrate(dry_run=args.dry_run)
+    migrator = DatabaseMigrator(sqlite_path, postgres_url, trust_source=args.trust_source)
+    try:
+        success = await migrator.migrate(dry_run=args.dry_run)
+    finally:
+        migrator.close()
     
     if success:
         logger.info("Migration completed successfully")
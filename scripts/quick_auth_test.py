@@ -18,6 +18,20 @@ load_test_env()
 import httpx
 import json
 
+try:
+    # HTTP/2 lets the concurrent endpoint probes share one connection/TLS handshake
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+async def _probe_endpoint(client, endpoint):
+    """请求单个端点，返回 (端点, 响应, 异常)"""
+    try:
+        return endpoint, await client.get(endpoint), None
+    except Exception as e:
+        return endpoint, None, e
+
 async def test_authentication():
     """测试API认证是否工作"""
     print("🔐 测试API认证...")
@@ -64,7 +78,9 @@ async def test_authentication():
     
     async with httpx.AsyncClient(
         base_url=base_url,
-        timeout=30.0,
+        http2=HAS_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        timeout=httpx.Timeout(30.0, connect=5.0),
         cookies=cookies,
         headers=headers,
         follow_redirects=True
@@ -77,10 +93,17 @@ async def test_authentication():
             "/api/v3/auth/me"  # 获取用户信息
         ]
         
-        for endpoint in test_endpoints:
-            try:
+        # 端点相互独立，并发请求；按完成顺序检查，任一成功即可结束
+        tasks = [asyncio.create_task(_probe_endpoint(client, endpoint)) for endpoint in test_endpoints]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                endpoint, response, error = await next_done
                 print(f"\n🧪 测试端点: {endpoint}")
-                response = await client.get(endpoint)
+                
+                if error is not None:
+                    print(f"   ❌ 请求失败: {error}")
+                    continue
                 
                 if response.status_code == 200:
                     print(f"   ✅ 成功! Status: {response.status_code}")
@@ -113,9 +136,12 @@ async def test_authentication():
                 else:
                     print(f"   ⚠️  状态码: {response.status_code}")
                     print(f"   响应: {response.text[:100]}...")
-                    
-            except Exception as e:
-                print(f"   ❌ 请求失败: {e}")
+        
+        finally:
+            # 已有结果时取消尚未完成的请求，避免遗留连接
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     print(f"\n❌ 所有端点都认证失败")
     print("\n🔧 解决方案:")
@@ -8,9 +8,9 @@ import json
 from pathlib import Path
 import sys
 
-# 添加src到Python路径
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# 添加项目根目录到Python路径，使 src.* 包导入在任意工作目录下可用
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
 from src.generators.test_generator import TestGenerator
 from src.database.models import SessionLocal
@@ -102,25 +102,34 @@ async def test_openapi_generation():
     # 生成测试
     result = await generator.generate_from_openapi(openapi_spec)
     
-    print("📊 生成结果:")
-    print(f"  成功: {result.get('success', False)}")
-    print(f"  生成文件数: {len(result.get('generated_files', []))}")
-    print(f"  处理端点数: {result.get('total_endpoints_processed', 0)}")
+    # 汇总输出一次性写出，避免逐行写入
+    lines = [
+        "📊 生成结果:",
+        f"  成功: {result.get('success', False)}",
+        f"  生成文件数: {len(result.get('generated_files', []))}",
+        f"  处理端点数: {result.get('total_endpoints_processed', 0)}",
+    ]
     
     if 'generated_files' in result:
-        print("\n📁 生成的测试文件:")
-        for file_path in result['generated_files']:
-            print(f"  ✓ {Path(file_path).name}")
+        lines.append("\n📁 生成的测试文件:")
+        lines.extend(f"  ✓ {Path(file_path).name}" for file_path in result['generated_files'])
     
     if 'quality_summary' in result:
         quality = result['quality_summary']
-        print(f"\n📈 质量统计:")
-        print(f"  平均质量分数: {quality.get('average_quality_score', 0):.2%}")
-        print(f"  文件总数: {quality.get('total_files', 0)}")
-        print(f"  通过质量检查: {quality.get('quality_passed_files', 0)}")
+        lines.extend([
+            f"\n📈 质量统计:",
+            f"  平均质量分数: {quality.get('average_quality_score', 0):.2%}",
+            f"  文件总数: {quality.get('total_files', 0)}",
+            f"  通过质量检查: {quality.get('quality_passed_files', 0)}",
+        ])
+    
+    if 'error' in result:
+        lines.append(f"❌ 错误: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     if 'error' in result:
-        print(f"❌ 错误: {result['error']}")
         return False
     
     return True
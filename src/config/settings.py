@@ -1,12 +1,19 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./test_automation.db"
     test_database_url: str = "sqlite:///./test_automation.db"
+    database_pool_size: int = 20             # Persistent connections kept by the engine pool
+    database_max_overflow: int = 10          # Extra connections allowed under burst load
+    database_pool_recycle: int = 1800        # Seconds before a pooled connection is replaced
+    database_pool_pre_ping: bool = True      # Check connections on checkout and drop stale ones
     apifox_webhook_secret: Optional[str] = None
     log_level: str = "INFO"
     test_output_dir: str = "./tests/generated"
+    generation_concurrency: int = 4          # Endpoints generated in parallel from OpenAPI specs
+    generation_cache_enabled: bool = True    # Reuse generated files for unchanged endpoint specs
     max_retry_attempts: int = 3
     retry_delay: int = 1
     
@@ -108,4 +115,10 @@ class Settings(BaseSettings):
     
     class Config:
         env_file = [".env.local", ".env.test", ".env"]
-        env_file_encoding = "utf-8"
\ No newline at end of file
+        env_file_encoding = "utf-8"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide settings, read from the environment and env files once"""
+    return Settings()
@@ -5,7 +5,7 @@ from sqlalchemy import create_engine
 from datetime import datetime, timezone
 import structlog
 import enum
-from src.config.settings import Settings
+from src.config.settings import get_settings
 
 logger = structlog.get_logger()
 Base = declarative_base()
@@ -105,7 +105,7 @@ class GeneratedTest(Base):
     webhook_event_id = Column(String(255), nullable=False)
     test_name = Column(String(255), nullable=False)
     test_content = Column(Text, nullable=False)
-    file_path = Column(String(500), nullable=False)
+    file_path = Column(String(500), nullable=False, index=True)  # Test runs update status by file
     status = Column(String(50), default="generated")
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     last_run_at = Column(DateTime, nullable=True)
@@ -181,7 +181,7 @@ class ReviewMetrics(Base):
 class WorkflowSlaPolicy(Base):
     __tablename__ = "workflow_sla_policies"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)  # primary key is already indexed
     priority = Column(Enum(ReviewPriority), nullable=False, unique=True, index=True)
     
     # SLA time limits in minutes
@@ -209,7 +209,7 @@ class WorkflowSlaPolicy(Base):
 class WorkflowSlaTracking(Base):
     __tablename__ = "workflow_sla_tracking"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)  # primary key is already indexed
     review_workflow_id = Column(Integer, ForeignKey("review_workflows.id"), nullable=False, index=True)
     sla_policy_id = Column(Integer, ForeignKey("workflow_sla_policies.id"), nullable=False, index=True)
     
@@ -656,18 +656,35 @@ Index('idx_performance_metrics_endpoint_time', PerformanceMetric.endpoint_path,
 Index('idx_template_usage_type_created', TemplateUsageMetric.template_type, TemplateUsageMetric.created_at)
 Index('idx_dashboard_alerts_status_severity', DashboardAlert.status, DashboardAlert.severity)
 Index('idx_metrics_cache_type_period', DashboardMetricsCache.metric_type, DashboardMetricsCache.time_period)
+Index('ix_sla_tracking_status_due', WorkflowSlaTracking.status, WorkflowSlaTracking.completion_due_at)
+Index(
+    'ix_sla_tracking_open_due',
+    WorkflowSlaTracking.completion_due_at,
+    sqlite_where=WorkflowSlaTracking.completed_at.is_(None),
+    postgresql_where=WorkflowSlaTracking.completed_at.is_(None)
+)
 
 engine = None
 SessionLocal = None
 
 async def init_db():
     global engine, SessionLocal
-    settings = Settings()
-    
-    engine = create_engine(
-        settings.database_url,
-        connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-    )
+    settings = get_settings()
+    
+    engine_options = {
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+        # Room for every model's compiled ORM statements (SQLAlchemy default: 500)
+        "query_cache_size": 1200,
+    }
+    if "sqlite" in settings.database_url:
+        engine_options["connect_args"] = {"check_same_thread": False}
+    else:
+        # Keep connections open across sessions instead of reconnecting per request
+        engine_options["pool_size"] = settings.database_pool_size
+        engine_options["max_overflow"] = settings.database_max_overflow
+    
+    engine = create_engine(settings.database_url, **engine_options)
     
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
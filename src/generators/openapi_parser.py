@@ -16,6 +16,9 @@ from urllib.parse import urlparse
 
 logger = structlog.get_logger()
 
+# Path template parameters such as {userId}
+PATH_PARAMETER_RE = re.compile(r'\{[^}]+\}')
+
 
 class EndpointComplexity(str, Enum):
     """Endpoint complexity levels for test strategy selection"""
@@ -675,28 +678,29 @@ class OpenAPIParser:
         """
         relationships = {}
         
-        for endpoint in endpoints:
-            related = []
-            
-            # Find endpoints with similar paths (CRUD operations)
-            base_path = re.sub(r'\{[^}]+\}', '', endpoint.path).rstrip('/')
-            
-            for other_endpoint in endpoints:
-                if other_endpoint.operation_id == endpoint.operation_id:
-                    continue
-                
-                other_base_path = re.sub(r'\{[^}]+\}', '', other_endpoint.path).rstrip('/')
-                
-                # Same resource, different operations
-                if base_path == other_base_path:
-                    related.append(other_endpoint.operation_id)
-                
-                # Parent-child resource relationships
-                elif (base_path.startswith(other_base_path) or 
-                      other_base_path.startswith(base_path)):
-                    related.append(other_endpoint.operation_id)
-            
-            relationships[endpoint.operation_id] = related
+        # Resource path of each endpoint, with path parameters stripped once
+        base_paths = [PATH_PARAMETER_RE.sub('', endpoint.path).rstrip('/') for endpoint in endpoints]
+        
+        # Same resource or parent-child resources are related. The check only
+        # depends on the resource paths, so decide it once per pair of
+        # distinct paths instead of once per pair of endpoints
+        unique_paths = dict.fromkeys(base_paths)
+        related_paths = {
+            base_path: {
+                other_base_path for other_base_path in unique_paths
+                if base_path.startswith(other_base_path) or other_base_path.startswith(base_path)
+            }
+            for base_path in unique_paths
+        }
+        
+        for endpoint, base_path in zip(endpoints, base_paths):
+            related_to_path = related_paths[base_path]
+            relationships[endpoint.operation_id] = [
+                other_endpoint.operation_id
+                for other_endpoint, other_base_path in zip(endpoints, base_paths)
+                if other_endpoint.operation_id != endpoint.operation_id
+                and other_base_path in related_to_path
+            ]
         
         return relationships
     
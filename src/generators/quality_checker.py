@@ -17,6 +17,37 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Static patterns used by every quality check, compiled once at import time
+IMPORT_LINE_RE = re.compile(r'^(?:from\s+\S+\s+)?import\s+(.+)$')
+TEST_METHOD_LINE_RE = re.compile(r'^\s*(?:async\s+)?def\s+(test_\w+)', re.MULTILINE)
+TEST_CLASS_LINE_RE = re.compile(r'^\s*class\s+(Test\w+)', re.MULTILINE)
+TEST_METHOD_RE = re.compile(r'def\s+(test_\w+)')
+TEST_CLASS_RE = re.compile(r'class\s+(Test\w+)')
+ASYNC_TEST_RE = re.compile(r'async\s+def\s+(test_\w+)')
+SYNC_TEST_RE = re.compile(r'^(?!.*async)\s*def\s+(test_\w+)', re.MULTILINE)
+# Alternatives never overlap, so one scan counts the same matches as four
+ASSERTION_RE = re.compile(r'assert\s+|\.assert_|pytest\.raises|pytest\.warns')
+TRY_BLOCK_RE = re.compile(r'try\s*:')
+EXCEPT_BLOCK_RE = re.compile(r'except\s+')
+PYTEST_RAISES_RE = re.compile(r'pytest\.raises')
+BARE_EXCEPT_RE = re.compile(r'except\s*:')
+SECURITY_PATTERNS = [
+    (re.compile(r'password\s*=\s*[\'"](?!.*placeholder|.*test|.*example)[^\'"]+[\'"]', re.IGNORECASE), 'hardcoded_password'),
+    (re.compile(r'token\s*=\s*[\'"](?!.*test|.*example)[a-zA-Z0-9+/]{20,}[\'"]', re.IGNORECASE), 'hardcoded_token'),
+    (re.compile(r'api_key\s*=\s*[\'"](?!.*test|.*example)[a-zA-Z0-9]{20,}[\'"]', re.IGNORECASE), 'hardcoded_api_key'),
+    (re.compile(r'secret\s*=\s*[\'"](?!.*test|.*example)[^\'"]+[\'"]', re.IGNORECASE), 'hardcoded_secret'),
+]
+PERFORMANCE_PATTERNS = [
+    (re.compile(r'for\s+\w+\s+in\s+range\s*\(\s*\d{3,}\s*\)'), 'large_loop'),
+    (re.compile(r'time\.sleep\s*\(\s*\d+'), 'blocking_sleep'),
+    (re.compile(r'\.json\(\s*\)\s*\[\s*[\'"][^\'"]*[\'"]\s*\]'), 'inefficient_json_access'),
+]
+ISOLATION_PATTERNS = [
+    (re.compile(r'global\s+\w+', re.DOTALL), 'global_variable'),
+    (re.compile(r'class\s+\w+:.*?def\s+\w+.*?\w+\s*=\s*[^=]', re.DOTALL), 'class_variable'),  # Class variables
+    (re.compile(r'@pytest\.fixture\s*\([^)]*scope\s*=\s*[\'"](?:module|session)[\'"]', re.DOTALL), 'shared_fixture'),
+]
+
 @dataclass
 class QualityIssue:
     """Represents a quality issue found in a test file"""
@@ -109,6 +140,30 @@ class TestQualityChecker:
             ))
             return report
         
+        return self.check_test_source(content, file_path, report)
+    
+    def check_test_source(self, content: str, file_path: str,
+                          report: Optional[TestQualityReport] = None) -> TestQualityReport:
+        """
+        Perform comprehensive quality check on already-loaded test source
+        
+        Args:
+            content: Source code of the test file
+            file_path: Path the source was loaded from (used in issues)
+            report: Existing report to populate, if any
+            
+        Returns:
+            TestQualityReport with detailed analysis
+        """
+        if report is None:
+            report = TestQualityReport(
+                file_path=file_path,
+                total_tests=0,
+                passed_checks=0,
+                total_checks=0,
+                quality_score=0.0
+            )
+        
         # Perform various quality checks
         checks = [
             self._check_syntax,
@@ -205,10 +260,9 @@ class TestQualityChecker:
             ))
         
         # Check for unused imports (basic check)
-        import_pattern = r'^(?:from\s+\S+\s+)?import\s+(.+)$'
         imports = []
         for line_num, line in enumerate(content.split('\n'), 1):
-            match = re.match(import_pattern, line.strip())
+            match = IMPORT_LINE_RE.match(line.strip())
             if match:
                 import_parts = match.group(1).split(',')
                 for part in import_parts:
@@ -231,8 +285,8 @@ class TestQualityChecker:
         issues = []
         
         # Count test methods
-        test_methods = re.findall(r'^\s*(?:async\s+)?def\s+(test_\w+)', content, re.MULTILINE)
-        test_classes = re.findall(r'^\s*class\s+(Test\w+)', content, re.MULTILINE)
+        test_methods = TEST_METHOD_LINE_RE.findall(content)
+        test_classes = TEST_CLASS_LINE_RE.findall(content)
         
         metrics = {
             'checks_performed': 3,
@@ -282,19 +336,10 @@ class TestQualityChecker:
         issues = []
         
         # Count assertions
-        assertion_patterns = [
-            r'assert\s+',
-            r'\.assert_',
-            r'pytest\.raises',
-            r'pytest\.warns'
-        ]
-        
-        total_assertions = 0
-        for pattern in assertion_patterns:
-            total_assertions += len(re.findall(pattern, content))
+        total_assertions = len(ASSERTION_RE.findall(content))
         
         # Count test methods for ratio calculation
-        test_methods = re.findall(r'def\s+(test_\w+)', content)
+        test_methods = TEST_METHOD_RE.findall(content)
         
         metrics = {
             'checks_performed': 2,
@@ -320,7 +365,7 @@ class TestQualityChecker:
             method_match = re.search(method_pattern, content, re.MULTILINE | re.DOTALL)
             if method_match:
                 method_content = method_match.group(0)
-                has_assertion = any(re.search(pattern, method_content) for pattern in assertion_patterns)
+                has_assertion = ASSERTION_RE.search(method_content) is not None
                 if not has_assertion:
                     issues.append(QualityIssue(
                         severity='warning',
@@ -357,8 +402,8 @@ class TestQualityChecker:
         issues = []
         
         # Find async test methods
-        async_tests = re.findall(r'async\s+def\s+(test_\w+)', content)
-        sync_tests = re.findall(r'^(?!.*async)\s*def\s+(test_\w+)', content, re.MULTILINE)
+        async_tests = ASYNC_TEST_RE.findall(content)
+        sync_tests = SYNC_TEST_RE.findall(content)
         
         metrics = {
             'checks_performed': 2,
@@ -398,9 +443,9 @@ class TestQualityChecker:
         issues = []
         
         # Count try-except blocks
-        try_blocks = re.findall(r'try\s*:', content)
-        except_blocks = re.findall(r'except\s+', content)
-        pytest_raises = re.findall(r'pytest\.raises', content)
+        try_blocks = TRY_BLOCK_RE.findall(content)
+        except_blocks = EXCEPT_BLOCK_RE.findall(content)
+        pytest_raises = PYTEST_RAISES_RE.findall(content)
         
         metrics = {
             'checks_performed': 1,
@@ -410,7 +455,7 @@ class TestQualityChecker:
         }
         
         # Check for bare except clauses
-        bare_except = re.findall(r'except\s*:', content)
+        bare_except = BARE_EXCEPT_RE.findall(content)
         for _ in bare_except:
             issues.append(QualityIssue(
                 severity='warning',
@@ -426,8 +471,8 @@ class TestQualityChecker:
         """Check test naming conventions"""
         issues = []
         
-        test_methods = re.findall(r'def\s+(test_\w+)', content)
-        test_classes = re.findall(r'class\s+(Test\w+)', content)
+        test_methods = TEST_METHOD_RE.findall(content)
+        test_classes = TEST_CLASS_RE.findall(content)
         
         metrics = {
             'checks_performed': len(test_methods) + len(test_classes),
@@ -466,7 +511,7 @@ class TestQualityChecker:
         issues = []
         
         # Check for docstrings in test methods
-        test_methods = re.findall(r'def\s+(test_\w+)', content)
+        test_methods = TEST_METHOD_RE.findall(content)
         documented_tests = 0
         
         for method in test_methods:
@@ -495,16 +540,9 @@ class TestQualityChecker:
         issues = []
         
         # Look for potential security issues
-        security_patterns = [
-            (r'password\s*=\s*[\'"](?!.*placeholder|.*test|.*example)[^\'"]+[\'"]', 'hardcoded_password'),
-            (r'token\s*=\s*[\'"](?!.*test|.*example)[a-zA-Z0-9+/]{20,}[\'"]', 'hardcoded_token'),
-            (r'api_key\s*=\s*[\'"](?!.*test|.*example)[a-zA-Z0-9]{20,}[\'"]', 'hardcoded_api_key'),
-            (r'secret\s*=\s*[\'"](?!.*test|.*example)[^\'"]+[\'"]', 'hardcoded_secret'),
-        ]
-        
         security_issues_found = 0
-        for pattern, issue_type in security_patterns:
-            matches = list(re.finditer(pattern, content, re.IGNORECASE))
+        for pattern, issue_type in SECURITY_PATTERNS:
+            matches = list(pattern.finditer(content))
             for match in matches:
                 line_num = content[:match.start()].count('\n') + 1
                 issues.append(QualityIssue(
@@ -518,7 +556,7 @@ class TestQualityChecker:
                 security_issues_found += 1
         
         metrics = {
-            'checks_performed': len(security_patterns),
+            'checks_performed': len(SECURITY_PATTERNS),
             'security_issues_found': security_issues_found
         }
         
@@ -529,14 +567,8 @@ class TestQualityChecker:
         issues = []
         
         # Check for potential performance issues
-        performance_patterns = [
-            (r'for\s+\w+\s+in\s+range\s*\(\s*\d{3,}\s*\)', 'large_loop'),
-            (r'time\.sleep\s*\(\s*\d+', 'blocking_sleep'),
-            (r'\.json\(\s*\)\s*\[\s*[\'"][^\'"]*[\'"]\s*\]', 'inefficient_json_access'),
-        ]
-        
-        for pattern, issue_type in performance_patterns:
-            matches = list(re.finditer(pattern, content))
+        for pattern, issue_type in PERFORMANCE_PATTERNS:
+            matches = list(pattern.finditer(content))
             for match in matches:
                 line_num = content[:match.start()].count('\n') + 1
                 issues.append(QualityIssue(
@@ -549,7 +581,7 @@ class TestQualityChecker:
                 ))
         
         metrics = {
-            'checks_performed': len(performance_patterns),
+            'checks_performed': len(PERFORMANCE_PATTERNS),
             'performance_issues': len(issues)
         }
         
@@ -560,14 +592,8 @@ class TestQualityChecker:
         issues = []
         
         # Look for shared state issues
-        isolation_patterns = [
-            (r'global\s+\w+', 'global_variable'),
-            (r'class\s+\w+:.*?def\s+\w+.*?\w+\s*=\s*[^=]', 'class_variable'),  # Class variables
-            (r'@pytest\.fixture\s*\([^)]*scope\s*=\s*[\'"](?:module|session)[\'"]', 'shared_fixture'),
-        ]
-        
-        for pattern, issue_type in isolation_patterns:
-            matches = list(re.finditer(pattern, content, re.DOTALL))
+        for pattern, issue_type in ISOLATION_PATTERNS:
+            matches = list(pattern.finditer(content))
             for match in matches:
                 line_num = content[:match.start()].count('\n') + 1
                 if issue_type != 'shared_fixture':  # Shared fixtures are warnings, not errors
@@ -581,7 +607,7 @@ class TestQualityChecker:
                     ))
         
         metrics = {
-            'checks_performed': len(isolation_patterns),
+            'checks_performed': len(ISOLATION_PATTERNS),
             'isolation_issues': len(issues)
         }
         
@@ -607,6 +633,23 @@ class TestQualityChecker:
         
         return reports
     
+    def check_test_collection_from_sources(self, sources: Dict[str, str]) -> List[TestQualityReport]:
+        """
+        Check quality of multiple test files whose sources are already loaded
+        
+        Args:
+            sources: Mapping of test file path to source code
+            
+        Returns:
+            List of TestQualityReport objects
+        """
+        self.logger.info(f"Checking quality of {len(sources)} test files")
+        
+        return [
+            self.check_test_source(content, file_path)
+            for file_path, content in sources.items()
+        ]
+    
     def validate_with_pytest(self, file_path: str) -> Tuple[bool, str]:
         """
         Validate test file with pytest collect-only
@@ -672,34 +672,52 @@ class TestDataFactory:
         Returns:
             Complete payload dictionary
         """
+        return self.compile_schema(schema)(category)
+    
+    def compile_schema(self, schema: Dict[str, Any]) -> Callable[[DataCategory], Dict[str, Any]]:
+        """
+        Pre-compute the field layout of an object schema for repeated payload generation
+        
+        Use this instead of generate_complete_payload when generating several
+        payloads from the same schema, e.g. one per data category.
+        
+        Args:
+            schema: Object schema with properties
+            
+        Returns:
+            Callable taking a DataCategory and returning a complete payload dictionary
+        """
         if schema.get('type') != 'object':
             raise ValueError("Schema must be of type 'object'")
         
         properties = schema.get('properties', {})
         required = schema.get('required', [])
         
-        payload = {}
-        
-        # Generate all required fields
-        for field_name in required:
-            if field_name in properties:
-                payload[field_name] = self.generate_for_schema(
-                    properties[field_name], category, field_name
-                )
+        required_fields = [
+            (field_name, properties[field_name])
+            for field_name in required if field_name in properties
+        ]
+        optional_fields = [f for f in properties.keys() if f not in required]
+        generate = self.generate_for_schema
         
-        # Generate some optional fields for realistic payloads
-        if category in [DataCategory.VALID, DataCategory.REALISTIC]:
-            optional_fields = [f for f in properties.keys() if f not in required]
-            if optional_fields:
+        def payload_for(category: DataCategory = DataCategory.VALID) -> Dict[str, Any]:
+            payload = {}
+            
+            # Generate all required fields
+            for field_name, field_schema in required_fields:
+                payload[field_name] = generate(field_schema, category, field_name)
+            
+            # Generate some optional fields for realistic payloads
+            if optional_fields and category in (DataCategory.VALID, DataCategory.REALISTIC):
                 num_optional = random.randint(0, min(len(optional_fields), 3))
                 selected_optional = random.sample(optional_fields, num_optional)
                 
                 for field_name in selected_optional:
-                    payload[field_name] = self.generate_for_schema(
-                        properties[field_name], category, field_name
-                    )
+                    payload[field_name] = generate(properties[field_name], category, field_name)
+            
+            return payload
         
-        return payload
+        return payload_for
     
     # =============================================================================
     # PHASE 2 ENHANCEMENTS: OpenAPI Schema-Aware Generation
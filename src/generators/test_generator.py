@@ -1,13 +1,21 @@
 import os
+import copy
+import json
+import shutil
+import hashlib
+import asyncio
 import structlog
+from dataclasses import asdict
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader
 from sqlalchemy.orm import Session
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from src.database.models import GeneratedTest
 from src.webhook.schemas import ApiFoxWebhook
-from src.config.settings import Settings
+from src.config.settings import get_settings
 
 # Week 3 Advanced Test Generators
 from src.generators.test_generators.error_generator import ErrorScenarioGenerator
@@ -18,7 +26,7 @@ from src.generators.test_generators.validation_generator import ValidationTestGe
 from src.generators.test_generators.boundary_generator import BoundaryTestGenerator
 from src.generators.test_generators.environment_generator import EnvironmentTestGenerator
 # from src.generators.test_generators.concurrency_generator import ConcurrencyTestGenerator  # DISABLED
-from src.generators.quality_checker import TestQualityChecker
+from src.generators.quality_checker import TestQualityChecker, TestQualityReport, QualityIssue
 from src.generators.config_manager import get_config_manager, TestType
 from src.generators.test_data_factory import TestDataFactory
 # from src.generators.enhanced_generator_adapter import EnhancedGeneratorAdapter  # 移除复杂适配器
@@ -32,13 +40,51 @@ from src.generators.test_classifier import get_test_classifier
 # from src.ai.models import TestQualityPredictor
 # from src.ai.quality_enhancer import AutomaticQualityEnhancer, BatchQualityEnhancer
 
+try:
+    # Faster canonical serialization of endpoint specs for cache keys
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = structlog.get_logger()
 
+# Generated files are cached per spec digest under
+# <test_output_dir>/.cache/<generator fingerprint>; the leading dot keeps
+# pytest from collecting the cached copies
+GENERATION_CACHE_DIRNAME = ".cache"
+# Quality report stored next to each cached file, so restored files skip the check
+GENERATION_CACHE_REPORT = "quality_report.json"
+# Number of generate_from_openapi results each generator keeps for unchanged specs
+OPENAPI_RESULT_CACHE_SIZE = 16
+
+# Cache roots already cleared of entries from other generator versions
+_pruned_cache_roots = set()
+
+
+@lru_cache(maxsize=1)
+def _generator_fingerprint() -> str:
+    """Fingerprint the templates and generator sources so edits invalidate the cache
+
+    Computed once per process, on the first cache lookup.
+    """
+    template_dir = Path(__file__).parent.parent / "templates"
+    sources = [*template_dir.glob("*.j2"), *Path(__file__).parent.rglob("*.py")]
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(sources):
+        stat = source.stat()
+        digest.update(f"{source.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return digest.hexdigest()
+
+
 class TestGenerator:
     def __init__(self):
-        self.settings = Settings()
+        # Private copy: callers adjust per-generator settings such as test_output_dir
+        self.settings = get_settings().model_copy()
         template_dir = Path(__file__).parent.parent / "templates"
         self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+        # Most recent generate_from_openapi results keyed by spec digest
+        self._openapi_results: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         
         # Initialize configuration manager and advanced generators
         self.config_manager = get_config_manager()
@@ -86,8 +132,15 @@ class TestGenerator:
             # TestType.CONCURRENCY: self.concurrency_generator  # DISABLED
         }
         
-    async def generate_tests_from_webhook(self, webhook: ApiFoxWebhook, db: Session):
-        """Generate pytest tests from ApiFox webhook data"""
+    async def generate_tests_from_webhook(self, webhook: ApiFoxWebhook, db: Session, commit: bool = True):
+        """Generate pytest tests from ApiFox webhook data
+        
+        Args:
+            webhook: ApiFox webhook payload
+            db: Database session the GeneratedTest rows are added to
+            commit: Commit the rows here; pass False to commit them together
+                with the caller's own changes in one transaction
+        """
         try:
             logger.info("Starting test generation", event_id=webhook.event_id)
             
@@ -118,7 +171,8 @@ class TestGenerator:
                 db.add(db_test)
                 generated_files.append(test_file_path)
             
-            db.commit()
+            if commit:
+                db.commit()
             
             logger.info("Tests generated successfully", 
                        event_id=webhook.event_id, 
@@ -676,98 +730,93 @@ class TestGenerator:
         else:
             raise ValueError(f"Unknown advanced test type: {test_type}")
     
-    async def generate_from_openapi(self, openapi_spec: dict) -> Dict[str, Any]:
-        """Generate tests from a full OpenAPI specification"""
+    async def generate_from_openapi(self, openapi_spec: dict,
+                                    paths: Optional[Iterable[Tuple[str, dict]]] = None,
+                                    max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Generate tests from a full OpenAPI specification
+        
+        Args:
+            openapi_spec: OpenAPI specification, used for paths and shared definitions
+            paths: Optional (path, path item) pairs to use instead of openapi_spec['paths'];
+                they are consumed once, so a lazy stream of path items works
+            max_concurrency: Maximum number of endpoints generated at the same time
+                (defaults to settings.generation_concurrency)
+            
+        Returns:
+            Dict containing generated files and quality results
+        """
         try:
+            # A spec already generated by this instance returns its previous
+            # result, as long as the files it produced are still on disk.
+            # Streamed paths are read only once, so they cannot be digested
+            spec_key = None
+            if paths is None and self.settings.generation_cache_enabled:
+                # Settings carry the output directory, which callers may change
+                spec_key = self._spec_digest([self._generation_config(), openapi_spec])
+                cached_result = self._openapi_results.get(spec_key)
+                if cached_result is not None and all(
+                    os.path.exists(file_path) for file_path in cached_result['generated_files']
+                ):
+                    logger.info("Reusing OpenAPI test generation result for unchanged spec",
+                               files_generated=len(cached_result['generated_files']))
+                    self._openapi_results.move_to_end(spec_key)
+                    # Callers get their own copy of the nested lists and dicts
+                    return copy.deepcopy(cached_result)
+            
             logger.info("Starting test generation from OpenAPI specification")
             
             generated_files = []
             quality_reports = []
+            total_endpoints = 0
             
             # Extract paths from OpenAPI spec
-            paths = openapi_spec.get('paths', {})
+            if paths is None:
+                paths = openapi_spec.get('paths', {}).items()
             
-            for path, path_data in paths.items():
-                for method, operation_data in path_data.items():
-                    if method.upper() not in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                        continue
-                    
-                    logger.info(f"Processing {method.upper()} {path}")
-                    
-                    # Convert OpenAPI operation to our internal API spec format
-                    api_spec = self._convert_openapi_to_internal(
-                        path, method, operation_data, openapi_spec
-                    )
-                    
-                    # Determine test types to generate
-                    test_types = self._determine_test_types(api_spec)
-                    
-                    for test_type in test_types:
-                        try:
-                            # Generate test content
-                            if test_type in ["performance", "validation", "boundary_testing", "environment_config", "concurrency"]:
-                                # Use advanced generators
-                                standardized_spec = self._standardize_api_spec(api_spec)
-                                test_file_path = self._generate_advanced_test_file(
-                                    standardized_spec, test_type
-                                )
-                                
-                                # Read content for database storage
-                                with open(test_file_path, 'r', encoding='utf-8') as f:
-                                    test_content = f.read()
-                            else:
-                                # Use template-based generation
-                                test_content = self._generate_test_content(api_spec, test_type)
-                                test_file_path = self._save_test_file(api_spec, test_content, test_type)
-                            
-                            # Perform quality check
-                            quality_report = self.quality_checker.check_test_file(test_file_path)
-                            quality_reports.append(quality_report)
-                            
-                            # Phase 3 AI Enhancement for OpenAPI generation
-                            if self.ai_enhancement_enabled and quality_report.quality_score < 0.95:
-                                try:
-                                    logger.info(f"AI enhancing OpenAPI test: {test_file_path} (quality: {quality_report.quality_score:.2%})")
-                                    
-                                    api_metadata = {
-                                        'endpoint': api_spec.get('name', 'unknown'),
-                                        'method': method.upper(),
-                                        'path': path,
-                                        'complexity': 'moderate',
-                                        'test_type': test_type
-                                    }
-                                    
-                                    enhancement_result = await self.ai_enhancer.enhance_test_quality(
-                                        test_file_path, api_metadata, target_quality=0.95
-                                    )
-                                    
-                                    if enhancement_result.success:
-                                        test_file_path = enhancement_result.enhanced_file
-                                        with open(test_file_path, 'r', encoding='utf-8') as f:
-                                            test_content = f.read()
-                                        
-                                        # Update quality report
-                                        quality_report = self.quality_checker.check_test_file(test_file_path)
-                                        quality_reports[-1] = quality_report
-                                        
-                                        logger.info(f"OpenAPI AI enhancement: {enhancement_result.quality_before:.2%} → {enhancement_result.quality_after:.2%}")
-                                
-                                except Exception as e:
-                                    logger.error(f"OpenAPI AI enhancement error: {str(e)}")
-                            
-                            # Check quality and handle accordingly
-                            min_quality = self.config_manager.config.quality.min_quality_score
-                            if quality_report.quality_score >= min_quality:
-                                generated_files.append(test_file_path)
-                                logger.info(f"Generated {test_type} test for {method.upper()} {path} with quality score: {quality_report.quality_score:.2%}")
-                            else:
-                                logger.warning(f"Generated {test_type} test for {method.upper()} {path} failed quality check: {quality_report.quality_score:.2%}")
-                                # Move to quarantine
-                                Path(test_file_path).rename(Path(test_file_path).with_suffix('.quarantine'))
-                        
-                        except Exception as e:
-                            logger.error(f"Failed to generate {test_type} test for {method.upper()} {path}: {str(e)}")
+            # Endpoints are generated concurrently; the semaphore is taken
+            # before each task is created so a lazy paths stream is only
+            # read as fast as endpoints complete
+            semaphore = asyncio.Semaphore(max_concurrency or self.settings.generation_concurrency)
+            tasks = []
+            # Latest task per output file stem; endpoints that would write the
+            # same files run after each other instead of racing
+            tasks_by_stem: Dict[str, asyncio.Task] = {}
+            
+            try:
+                for path, path_data in paths:
+                    total_endpoints += len(path_data)
+                    for method, operation_data in path_data.items():
+                        if method.upper() not in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
                             continue
+                        
+                        stem = self._openapi_output_stem(path, method, operation_data)
+                        previous = tasks_by_stem.get(stem)
+                        if previous is not None:
+                            logger.warning("Endpoints share output file names, generating them in turn",
+                                           path=path, method=method.upper(), stem=stem)
+                        
+                        await semaphore.acquire()
+                        task = asyncio.create_task(
+                            self._generate_openapi_endpoint_after(
+                                previous, path, method, operation_data, openapi_spec
+                            )
+                        )
+                        task.add_done_callback(lambda _: semaphore.release())
+                        tasks.append(task)
+                        tasks_by_stem[stem] = task
+                
+                # Results are collected in endpoint order
+                endpoint_results = await asyncio.gather(*tasks)
+            finally:
+                # Don't leave endpoint tasks running if scheduling or one of them failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for endpoint_files, endpoint_reports in endpoint_results:
+                generated_files.extend(endpoint_files)
+                quality_reports.extend(endpoint_reports)
             
             # Generate quality summary
             quality_summary = self.quality_checker.generate_quality_summary(quality_reports)
@@ -776,7 +825,7 @@ class TestGenerator:
                 "success": True,
                 "generated_files": generated_files,
                 "quality_summary": quality_summary,
-                "total_endpoints_processed": len([path for path_data in paths.values() for method in path_data.keys()]),
+                "total_endpoints_processed": total_endpoints,
                 "quality_reports": [
                     {
                         "file": report.file_path,
@@ -791,12 +840,244 @@ class TestGenerator:
                        files_generated=len(generated_files),
                        avg_quality_score=quality_summary.get('average_quality_score', 0))
             
+            if spec_key is not None:
+                self._openapi_results[spec_key] = copy.deepcopy(result)
+                self._openapi_results.move_to_end(spec_key)
+                while len(self._openapi_results) > OPENAPI_RESULT_CACHE_SIZE:
+                    self._openapi_results.popitem(last=False)
+            
             return result
             
         except Exception as e:
             logger.error("Failed to generate tests from OpenAPI spec", error=str(e))
             return {"error": str(e)}
     
+    def _openapi_output_stem(self, path: str, method: str, operation_data: dict) -> str:
+        """Name part shared by every test file generated for an OpenAPI operation"""
+        # Template files add the method, advanced generators don't, so the
+        # stem leaves it out to cover both
+        name = operation_data.get('summary', f"{method.upper()} {path}")
+        return name.lower().replace(' ', '_').replace('-', '_')
+    
+    async def _generate_openapi_endpoint_after(self, previous: Optional[asyncio.Task], path: str, method: str,
+                                               operation_data: dict, openapi_spec: dict
+                                               ) -> Tuple[List[str], List[TestQualityReport]]:
+        """Generate an OpenAPI operation once the task writing the same files has finished"""
+        if previous is not None:
+            # Only ordering matters here; the previous task's own result or
+            # error is reported through its own gather slot
+            await asyncio.wait([previous])
+        return await self._generate_openapi_endpoint(path, method, operation_data, openapi_spec)
+    
+    async def _generate_openapi_endpoint(self, path: str, method: str, operation_data: dict,
+                                         openapi_spec: dict) -> Tuple[List[str], List[TestQualityReport]]:
+        """
+        Generate and quality-check every test type for a single OpenAPI operation
+        
+        Returns:
+            Tuple of (files that passed the quality check, quality reports)
+        """
+        generated_files = []
+        quality_reports = []
+        
+        logger.info(f"Processing {method.upper()} {path}")
+        
+        # Convert OpenAPI operation to our internal API spec format
+        api_spec = self._convert_openapi_to_internal(
+            path, method, operation_data, openapi_spec
+        )
+        
+        # Determine test types to generate
+        test_types = self._determine_test_types(api_spec)
+        
+        for test_type in test_types:
+            try:
+                # Rendering, writing and checking the file is blocking work,
+                # so it runs off the event loop while other endpoints proceed
+                test_file_path, test_content, quality_report = await asyncio.to_thread(
+                    self._build_openapi_test_file, api_spec, test_type
+                )
+                quality_reports.append(quality_report)
+                
+                # Phase 3 AI Enhancement for OpenAPI generation
+                if self.ai_enhancement_enabled and quality_report.quality_score < 0.95:
+                    try:
+                        logger.info(f"AI enhancing OpenAPI test: {test_file_path} (quality: {quality_report.quality_score:.2%})")
+                        
+                        api_metadata = {
+                            'endpoint': api_spec.get('name', 'unknown'),
+                            'method': method.upper(),
+                            'path': path,
+                            'complexity': 'moderate',
+                            'test_type': test_type
+                        }
+                        
+                        enhancement_result = await self.ai_enhancer.enhance_test_quality(
+                            test_file_path, api_metadata, target_quality=0.95
+                        )
+                        
+                        if enhancement_result.success:
+                            test_file_path = enhancement_result.enhanced_file
+                            with open(test_file_path, 'r', encoding='utf-8') as f:
+                                test_content = f.read()
+                            
+                            # Update quality report
+                            quality_report = self.quality_checker.check_test_file(test_file_path)
+                            quality_reports[-1] = quality_report
+                            
+                            logger.info(f"OpenAPI AI enhancement: {enhancement_result.quality_before:.2%} → {enhancement_result.quality_after:.2%}")
+                    
+                    except Exception as e:
+                        logger.error(f"OpenAPI AI enhancement error: {str(e)}")
+                
+                # Check quality and handle accordingly
+                min_quality = self.config_manager.config.quality.min_quality_score
+                if quality_report.quality_score >= min_quality:
+                    generated_files.append(test_file_path)
+                    logger.info(f"Generated {test_type} test for {method.upper()} {path} with quality score: {quality_report.quality_score:.2%}")
+                else:
+                    logger.warning(f"Generated {test_type} test for {method.upper()} {path} failed quality check: {quality_report.quality_score:.2%}")
+                    # Move to quarantine
+                    Path(test_file_path).rename(Path(test_file_path).with_suffix('.quarantine'))
+            
+            except Exception as e:
+                logger.error(f"Failed to generate {test_type} test for {method.upper()} {path}: {str(e)}")
+                continue
+        
+        return generated_files, quality_reports
+    
+    def _build_openapi_test_file(self, api_spec: dict, test_type: str) -> Tuple[str, str, TestQualityReport]:
+        """Generate one test file and run the quality check; returns (path, content, report)
+
+        Files generated for an identical spec, test type and configuration are
+        restored from the on-disk cache together with their quality report,
+        so neither rendering nor the quality check runs again.
+        """
+        cache_dir = None
+        if self.settings.generation_cache_enabled:
+            cache_root = Path(self.settings.test_output_dir) / GENERATION_CACHE_DIRNAME
+            fingerprint = _generator_fingerprint()
+            self._prune_generation_cache(cache_root, fingerprint)
+            cache_dir = cache_root / fingerprint / self._generation_cache_key(api_spec, test_type)
+            cached = self._load_cached_test_file(cache_dir)
+            if cached is not None:
+                # Unchanged endpoint: restore the cached file into the output directory
+                cached_file, quality_report = cached
+                test_file_path = str(Path(self.settings.test_output_dir) / cached_file.name)
+                shutil.copyfile(cached_file, test_file_path)
+                test_content = cached_file.read_text(encoding='utf-8')
+                logger.debug("Reused cached test file", file=test_file_path, test_type=test_type)
+                return test_file_path, test_content, quality_report
+        
+        if test_type in ["performance", "validation", "boundary_testing", "environment_config", "concurrency"]:
+            # Use advanced generators
+            standardized_spec = self._standardize_api_spec(api_spec)
+            test_file_path = self._generate_advanced_test_file(
+                standardized_spec, test_type
+            )
+            
+            # Read content for database storage
+            with open(test_file_path, 'r', encoding='utf-8') as f:
+                test_content = f.read()
+        else:
+            # Use template-based generation
+            test_content = self._generate_test_content(api_spec, test_type)
+            test_file_path = self._save_test_file(api_spec, test_content, test_type)
+        
+        # Perform quality check
+        quality_report = self.quality_checker.check_test_file(test_file_path)
+        
+        if cache_dir is not None:
+            self._store_cached_test_file(cache_dir, test_file_path, quality_report)
+        
+        return test_file_path, test_content, quality_report
+    
+    @staticmethod
+    def _prune_generation_cache(cache_root: Path, fingerprint: str) -> None:
+        """Remove cache entries written by other versions of the templates and generators"""
+        if cache_root in _pruned_cache_roots:
+            return
+        _pruned_cache_roots.add(cache_root)
+        
+        try:
+            with os.scandir(cache_root) as entries:
+                stale = [entry.path for entry in entries
+                         if entry.name != fingerprint and entry.is_dir()]
+        except FileNotFoundError:
+            return
+        
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+        if stale:
+            logger.info("Pruned stale generation cache entries", cache_root=str(cache_root), removed=len(stale))
+    
+    def _generation_cache_key(self, api_spec: dict, test_type: str) -> str:
+        """Digest of everything besides the generator version that determines the generated file"""
+        return self._spec_digest([self._generation_config(), test_type, api_spec])
+    
+    def _generation_config(self) -> List[Dict[str, Any]]:
+        """Settings and generation config that affect generated files, for cache keys"""
+        # They feed the templates (base URL, enabled test types) and the
+        # quality thresholds
+        return [
+            self.settings.model_dump(mode='json'),
+            self.config_manager.config.model_dump(mode='json'),
+        ]
+    
+    @staticmethod
+    def _spec_digest(key_data: Any) -> str:
+        """BLAKE2b digest of the canonical (sorted-key) JSON form of key_data"""
+        if HAS_ORJSON:
+            # Specs built in Python may use integer response codes as keys
+            payload = orjson.dumps(
+                key_data, default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(
+                key_data, sort_keys=True, separators=(',', ':'), default=str
+            ).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _load_cached_test_file(cache_dir: Path) -> Optional[Tuple[Path, TestQualityReport]]:
+        """Return the cached test file and its quality report stored under cache_dir, if any"""
+        try:
+            report_data = json.loads((cache_dir / GENERATION_CACHE_REPORT).read_text(encoding='utf-8'))
+            with os.scandir(cache_dir) as entries:
+                cached_file = next(
+                    (Path(entry.path) for entry in entries
+                     if entry.name.endswith('.py') and entry.is_file()),
+                    None
+                )
+        except (OSError, ValueError):
+            return None
+        
+        if cached_file is None:
+            return None
+        
+        report_data['issues'] = [QualityIssue(**issue) for issue in report_data.get('issues', [])]
+        return cached_file, TestQualityReport(**report_data)
+    
+    @staticmethod
+    def _store_cached_test_file(cache_dir: Path, test_file_path: str,
+                                quality_report: TestQualityReport) -> None:
+        """Copy a freshly generated test file and its report into the cache; failures only cost a regeneration"""
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            source = Path(test_file_path)
+            # Write under temporary names so readers never see a partial entry;
+            # the report goes last because lookups require it
+            partial = cache_dir / f"{source.name}.tmp"
+            shutil.copyfile(source, partial)
+            os.replace(partial, cache_dir / source.name)
+            
+            partial = cache_dir / f"{GENERATION_CACHE_REPORT}.tmp"
+            partial.write_text(json.dumps(asdict(quality_report), default=str), encoding='utf-8')
+            os.replace(partial, cache_dir / GENERATION_CACHE_REPORT)
+        except OSError as e:
+            logger.warning("Failed to cache generated test file", file=test_file_path, error=str(e))
+    
     def _convert_openapi_to_internal(self, path: str, method: str, operation_data: dict, openapi_spec: dict) -> dict:
         """Convert OpenAPI operation to internal API spec format"""
         return {
@@ -1384,7 +1665,10 @@ class TestGenerator:
         logger.info(f"Starting batch enhancement of tests in {test_directory}")
         
         # Create API metadata map for all files
-        test_files = list(Path(test_directory).glob("**/test_*.py"))
+        test_files = [
+            test_file for test_file in Path(test_directory).glob("**/test_*.py")
+            if GENERATION_CACHE_DIRNAME not in test_file.parts
+        ]
         api_metadata_map = {}
         
         for test_file in test_files:
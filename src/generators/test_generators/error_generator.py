@@ -332,18 +332,21 @@ class ErrorScenarioGenerator:
         
         return type_invalid_values.get(field_type)
     
-    def generate_test_file(self, api_spec: Dict[str, Any], output_dir: str) -> str:
+    def generate_test_file(self, api_spec: Dict[str, Any], output_dir: str,
+                           scenarios: Optional[List[ErrorScenario]] = None) -> str:
         """
         Generate a complete error scenario test file
         
         Args:
             api_spec: API specification dictionary
             output_dir: Directory to save the test file
+            scenarios: Scenarios already generated for api_spec, if any
             
         Returns:
             Path to the generated test file
         """
-        scenarios = self.generate_error_scenarios(api_spec)
+        if scenarios is None:
+            scenarios = self.generate_error_scenarios(api_spec)
         
         # Generate test file content
         test_content = self._generate_test_file_content(api_spec, scenarios)
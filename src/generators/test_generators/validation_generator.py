@@ -723,18 +723,21 @@ class ValidationTestGenerator:
         
         return tests
     
-    def generate_test_file(self, api_spec: Dict[str, Any], output_dir: str) -> str:
+    def generate_test_file(self, api_spec: Dict[str, Any], output_dir: str,
+                           tests: Optional[List[ValidationTest]] = None) -> str:
         """
         Generate a complete validation test file
         
         Args:
             api_spec: API specification dictionary
             output_dir: Directory to save the test file
+            tests: Validation tests already generated for api_spec, if any
             
         Returns:
             Path to the generated test file
         """
-        tests = self.generate_validation_tests(api_spec)
+        if tests is None:
+            tests = self.generate_validation_tests(api_spec)
         
         if not tests:
             self.logger.warning(f"No validation tests generated for {api_spec.get('path')}")
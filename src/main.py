@@ -5,7 +5,7 @@ Main FastAPI application for AI API Test Automation.
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.config.settings import Settings
+from src.config.settings import get_settings
 from src.database.models import init_db
 from src.webhook.routes import webhook_router
 from src.utils.logging import setup_logging
@@ -21,7 +21,7 @@ def create_app() -> FastAPI:
         FastAPI: Configured FastAPI application instance
     """
     # Initialize settings
-    settings = Settings()
+    settings = get_settings()
     
     # Setup logging
     setup_logging()
@@ -1,11 +1,47 @@
+import json
+import math
 import structlog
 import logging
 import sys
-from src.config.settings import Settings
+from src.config.settings import get_settings
+
+try:
+    # Faster JSON rendering of log events
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _has_non_finite_float(obj) -> bool:
+    """Check whether a log event contains NaN or Infinity anywhere"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+def _orjson_serializer(obj, **kwargs) -> str:
+    """json.dumps-compatible serializer for JSONRenderer backed by orjson"""
+    try:
+        rendered = orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        )
+    except (TypeError, orjson.JSONEncodeError):
+        # Integers wider than 64 bits and other values orjson rejects
+        return json.dumps(obj, **kwargs)
+    
+    # orjson writes NaN/Infinity as null; keep the stdlib rendering for them
+    if b"null" in rendered and _has_non_finite_float(obj):
+        return json.dumps(obj, **kwargs)
+    
+    # The stdlib logger factory expects str, orjson returns bytes
+    return rendered.decode("utf-8")
 
 def setup_logging():
     """Configure structured logging for the application"""
-    settings = Settings()
+    settings = get_settings()
     
     logging.basicConfig(
         format="%(message)s",
@@ -22,7 +58,9 @@ def setup_logging():
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_serializer if HAS_ORJSON else json.dumps
+            )
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -9,7 +9,7 @@ from tenacity import (
     retry_if_exception_type,
     before_sleep_log
 )
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 
 logger = structlog.get_logger()
 
@@ -17,7 +17,7 @@ class RetryHandler:
     """Handle retry logic for webhook processing with exponential backoff"""
     
     def __init__(self, settings: Optional[Settings] = None):
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
     
     def with_retry(
         self, 
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 
 logger = structlog.get_logger()
 
@@ -37,7 +37,7 @@ class TestRunner:
     """Execute generated tests and collect results"""
     
     def __init__(self, settings: Optional[Settings] = None):
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
     
     async def run_tests(
         self, 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, BackgroundTasks
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import Session
 import structlog
 from datetime import datetime, timezone
@@ -45,17 +46,24 @@ async def process_webhook_with_retry(webhook_data: ApiFoxWebhook, db: Session):
 async def _generate_tests_internal(webhook_data: ApiFoxWebhook, db: Session):
     """Internal test generation logic"""
     generator = TestGenerator()
-    await generator.generate_tests_from_webhook(webhook_data, db)
-    
-    # Update webhook event as processed
-    db_event = db.query(WebhookEvent).filter(
-        WebhookEvent.event_id == webhook_data.event_id
-    ).first()
-    
-    if db_event:
-        db_event.processed = True
-        db_event.processed_at = datetime.now(timezone.utc)
+    # The generated tests and the processed flag are committed together, so
+    # a retry after a failure does not insert the tests a second time
+    try:
+        await generator.generate_tests_from_webhook(webhook_data, db, commit=False)
+        
+        # Update webhook event as processed
+        db_event = db.query(WebhookEvent).filter(
+            WebhookEvent.event_id == webhook_data.event_id
+        ).first()
+        
+        if db_event:
+            db_event.processed = True
+            db_event.processed_at = datetime.now(timezone.utc)
         db.commit()
+    except Exception:
+        # Drop the pending rows so the retry starts from a clean session
+        db.rollback()
+        raise
 
 async def process_enhanced_webhook_generation(webhook_data: ApiFoxWebhook, db: Session):
     """Process webhook using enhanced generators with quality gates and fallback"""
@@ -285,24 +293,44 @@ async def retry_failed_events(background_tasks: BackgroundTasks, db: Session = D
         "events_retried": len(failed_events)
     }
 
+def _select_test_files(db: Session, test_ids: List[int] = None) -> List[str]:
+    """File paths of the given generated tests (all tests when no ids are given)"""
+    query = select(GeneratedTest.file_path)
+    if test_ids:
+        query = query.where(GeneratedTest.id.in_(test_ids))
+    
+    return list(db.scalars(query))
+
 @webhook_router.get("/generated-tests")
 async def list_generated_tests(db: Session = Depends(get_db)):
     """List all generated test files"""
-    tests = db.query(GeneratedTest).all()
+    # Only the listed columns are read (test_content can be large) instead
+    # of materializing full ORM objects
+    rows = db.execute(
+        select(
+            GeneratedTest.id,
+            GeneratedTest.test_name,
+            GeneratedTest.file_path,
+            GeneratedTest.status,
+            GeneratedTest.created_at,
+            GeneratedTest.webhook_event_id
+        )
+    )
+    tests = [
+        {
+            "id": row.id,
+            "test_name": row.test_name,
+            "file_path": row.file_path,
+            "status": row.status,
+            "created_at": row.created_at,
+            "webhook_event_id": row.webhook_event_id
+        }
+        for row in rows
+    ]
     
     return {
         "total_tests": len(tests),
-        "tests": [
-            {
-                "id": test.id,
-                "test_name": test.test_name,
-                "file_path": test.file_path,
-                "status": test.status,
-                "created_at": test.created_at,
-                "webhook_event_id": test.webhook_event_id
-            }
-            for test in tests
-        ]
+        "tests": tests
     }
 
 @webhook_router.post("/generate-enhanced-tests")
@@ -393,17 +421,11 @@ async def run_generated_tests(
     """Execute generated tests and return results"""
     try:
         # Get test files to run
-        query = db.query(GeneratedTest)
-        if test_ids:
-            query = query.filter(GeneratedTest.id.in_(test_ids))
-        
-        tests = query.all()
+        test_files = _select_test_files(db, test_ids)
         
-        if not tests:
+        if not test_files:
             raise HTTPException(status_code=404, detail="No tests found")
         
-        test_files = [test.file_path for test in tests]
-        
         # Run tests in background
         background_tasks.add_task(
             _execute_tests_background,
@@ -430,17 +452,11 @@ async def validate_generated_tests(
     """Validate syntax of generated test files"""
     try:
         # Get test files to validate
-        query = db.query(GeneratedTest)
-        if test_ids:
-            query = query.filter(GeneratedTest.id.in_(test_ids))
-        
-        tests = query.all()
+        test_files = _select_test_files(db, test_ids)
         
-        if not tests:
+        if not test_files:
             raise HTTPException(status_code=404, detail="No tests found")
         
-        test_files = [test.file_path for test in tests]
-        
         # Run syntax validation
         validation_results = await test_runner.run_syntax_check(test_files)
         
@@ -474,15 +490,31 @@ async def _execute_tests_background(
         report_file = f"/tmp/test_report_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.html"
         test_runner.generate_html_report(report, report_file)
         
-        # Update test statuses in database based on results
-        for result in report.results:
-            test = db.query(GeneratedTest).filter(
-                GeneratedTest.file_path == result.file_path
-            ).first()
-            
-            if test:
-                test.status = f"executed_{result.status}"
-                test.last_run_at = result.timestamp
+        # Update test statuses in database based on results. One executemany
+        # UPDATE instead of loading every GeneratedTest row (test_content
+        # included) just to set two columns; unknown files match no rows.
+        # Repeat webhooks can store several tests with the same file_path, and
+        # only the first of them (lowest id) is updated
+        if report.results:
+            tests = GeneratedTest.__table__
+            first_test_id = (
+                select(func.min(tests.c.id))
+                .where(tests.c.file_path == bindparam("result_file_path"))
+                .scalar_subquery()
+            )
+            db.execute(
+                update(tests)
+                .where(tests.c.id == first_test_id)
+                .values(status=bindparam("result_status"), last_run_at=bindparam("result_run_at")),
+                [
+                    {
+                        "result_file_path": result.file_path,
+                        "result_status": f"executed_{result.status}",
+                        "result_run_at": result.timestamp
+                    }
+                    for result in report.results
+                ]
+            )
         
         db.commit()
         
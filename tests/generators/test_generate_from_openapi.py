@@ -0,0 +1,188 @@
+import asyncio
+import pytest
+from pathlib import Path
+from src.generators import test_generator as test_generator_module
+from src.generators.test_generator import TestGenerator
+
+
+def _operation(summary):
+    """Build a minimal OpenAPI operation"""
+    return {"summary": summary, "responses": {"200": {"description": "OK"}}}
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Create a generator writing into a temporary output directory"""
+    generator = TestGenerator()
+    generator.settings.test_output_dir = str(tmp_path)
+    return generator
+
+
+class TestGenerateFromOpenAPIConcurrency:
+    """Test concurrent endpoint generation in generate_from_openapi"""
+
+    async def test_endpoints_run_concurrently_within_limit(self, generator, monkeypatch):
+        """Test that endpoints overlap up to max_concurrency and results keep endpoint order"""
+        running = 0
+        peak = 0
+
+        async def fake_endpoint(path, method, operation_data, openapi_spec):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later endpoints finish first, so ordering can't come from completion
+            await asyncio.sleep(0.01 * (5 - len(path)))
+            running -= 1
+            return [f"{path}:{method}"], []
+
+        monkeypatch.setattr(generator, "_generate_openapi_endpoint", fake_endpoint)
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {f"/{'a' * i}": {"get": _operation(f"Endpoint {i}")} for i in range(1, 5)}
+        }
+
+        result = await generator.generate_from_openapi(spec, max_concurrency=2)
+
+        assert peak == 2
+        assert result["generated_files"] == ["/a:get", "/aa:get", "/aaa:get", "/aaaa:get"]
+
+    async def test_colliding_output_names_are_not_generated_concurrently(self, generator, monkeypatch):
+        """Test that endpoints writing the same files run one after the other"""
+        running = set()
+        overlaps = []
+        order = []
+
+        async def fake_endpoint(path, method, operation_data, openapi_spec):
+            stem = generator._openapi_output_stem(path, method, operation_data)
+            if stem in running:
+                overlaps.append(stem)
+            running.add(stem)
+            await asyncio.sleep(0.01)
+            running.discard(stem)
+            order.append((path, method))
+            return [f"{path}:{method}"], []
+
+        monkeypatch.setattr(generator, "_generate_openapi_endpoint", fake_endpoint)
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/users": {"get": _operation("User"), "post": _operation("User")},
+                "/accounts": {"get": _operation("Account")},
+                "/v2/users": {"get": _operation("User")},
+            }
+        }
+
+        result = await generator.generate_from_openapi(spec, max_concurrency=4)
+
+        assert overlaps == []
+        assert result["generated_files"] == ["/users:get", "/users:post", "/accounts:get", "/v2/users:get"]
+        user_order = [entry for entry in order if entry[0] != "/accounts"]
+        assert user_order == [("/users", "get"), ("/users", "post"), ("/v2/users", "get")]
+
+    async def test_scheduling_error_leaves_no_pending_tasks(self, generator, monkeypatch):
+        """Test that tasks already started are cleaned up when the paths stream fails"""
+        async def slow_endpoint(path, method, operation_data, openapi_spec):
+            await asyncio.sleep(10)
+            return [], []
+
+        def failing_paths():
+            yield "/users", {"get": _operation("List users")}
+            raise RuntimeError("spec stream broken")
+
+        monkeypatch.setattr(generator, "_generate_openapi_endpoint", slow_endpoint)
+
+        result = await generator.generate_from_openapi({"openapi": "3.0.0"}, paths=failing_paths())
+
+        assert result == {"error": "spec stream broken"}
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.fixture
+def endpoint_calls(generator, monkeypatch):
+    """Replace endpoint generation with one that writes a file per call"""
+    calls = []
+
+    async def fake_endpoint(path, method, operation_data, openapi_spec):
+        calls.append((path, method))
+        test_file = Path(generator.settings.test_output_dir) / f"test_{len(calls)}.py"
+        test_file.parent.mkdir(parents=True, exist_ok=True)
+        test_file.write_text("", encoding="utf-8")
+        return [str(test_file)], []
+
+    monkeypatch.setattr(generator, "_generate_openapi_endpoint", fake_endpoint)
+    return calls
+
+
+def _spec(title):
+    """Build a single-endpoint OpenAPI spec"""
+    return {"openapi": "3.0.0", "info": {"title": title}, "paths": {"/users": {"get": _operation("List users")}}}
+
+
+class TestGenerateFromOpenAPIMemo:
+    """Test the per-generator memo of generate_from_openapi results"""
+
+    async def test_second_call_hits_memo_and_is_isolated(self, generator, endpoint_calls):
+        """Test that an unchanged spec is not regenerated and results don't share state"""
+        first = await generator.generate_from_openapi(_spec("api"))
+        first["generated_files"].append("mutated")
+        first["quality_summary"]["mutated"] = True
+
+        second = await generator.generate_from_openapi(_spec("api"))
+        second["generated_files"].clear()
+
+        third = await generator.generate_from_openapi(_spec("api"))
+
+        assert len(endpoint_calls) == 1
+        assert "mutated" not in third["generated_files"]
+        assert "mutated" not in third["quality_summary"]
+        assert len(third["generated_files"]) == 1
+
+    async def test_output_dir_change_misses(self, generator, endpoint_calls, tmp_path):
+        """Test that the same spec generated into another directory is not reused"""
+        await generator.generate_from_openapi(_spec("api"))
+
+        generator.settings.test_output_dir = str(tmp_path / "other")
+        result = await generator.generate_from_openapi(_spec("api"))
+
+        assert len(endpoint_calls) == 2
+        assert result["generated_files"][0].startswith(str(tmp_path / "other"))
+
+    async def test_memo_is_bounded(self, generator, endpoint_calls, monkeypatch):
+        """Test that the least recently used result is evicted"""
+        monkeypatch.setattr(test_generator_module, "OPENAPI_RESULT_CACHE_SIZE", 2)
+
+        await generator.generate_from_openapi(_spec("a"))
+        await generator.generate_from_openapi(_spec("b"))
+        await generator.generate_from_openapi(_spec("a"))
+        await generator.generate_from_openapi(_spec("c"))
+        assert len(generator._openapi_results) == 2
+
+        await generator.generate_from_openapi(_spec("a"))
+        await generator.generate_from_openapi(_spec("b"))
+
+        assert len(endpoint_calls) == 4
+
+    async def test_settings_change_misses(self, generator, endpoint_calls):
+        """Test that changed settings regenerate an unchanged spec"""
+        await generator.generate_from_openapi(_spec("api"))
+
+        generator.settings.test_api_base_url = "http://example.invalid:8080"
+        await generator.generate_from_openapi(_spec("api"))
+
+        assert len(endpoint_calls) == 2
+
+    async def test_changed_spec_misses(self, generator, endpoint_calls):
+        """Test that a different spec is generated again"""
+        await generator.generate_from_openapi(_spec("a"))
+        await generator.generate_from_openapi(_spec("b"))
+
+        assert len(endpoint_calls) == 2
+
+    async def test_deleted_files_miss(self, generator, endpoint_calls):
+        """Test that a result whose files are gone is not reused"""
+        first = await generator.generate_from_openapi(_spec("api"))
+        Path(first["generated_files"][0]).unlink()
+
+        await generator.generate_from_openapi(_spec("api"))
+
+        assert len(endpoint_calls) == 2
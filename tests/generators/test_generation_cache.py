@@ -0,0 +1,117 @@
+import pytest
+from pathlib import Path
+from src.generators import test_generator as test_generator_module
+from src.generators.test_generator import TestGenerator, GENERATION_CACHE_DIRNAME
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Create a generator writing into a temporary output directory"""
+    generator = TestGenerator()
+    generator.settings.test_output_dir = str(tmp_path)
+    generator.settings.generation_cache_enabled = True
+    return generator
+
+
+@pytest.fixture
+def api_spec(generator):
+    """Create an internal API spec for a simple GET endpoint"""
+    operation = {
+        "summary": "Get user",
+        "operationId": "get_user",
+        "responses": {"200": {"description": "OK"}}
+    }
+    return generator._convert_openapi_to_internal("/users/{id}", "get", operation, {})
+
+
+@pytest.fixture
+def build_calls(generator, monkeypatch):
+    """Count template renders and quality checks"""
+    calls = {"render": 0, "check": 0}
+    render = generator._generate_test_content
+    check = generator.quality_checker.check_test_file
+
+    def counting_render(*args, **kwargs):
+        calls["render"] += 1
+        return render(*args, **kwargs)
+
+    def counting_check(*args, **kwargs):
+        calls["check"] += 1
+        return check(*args, **kwargs)
+
+    monkeypatch.setattr(generator, "_generate_test_content", counting_render)
+    monkeypatch.setattr(generator.quality_checker, "check_test_file", counting_check)
+    return calls
+
+
+class TestGenerationCache:
+    """Test the on-disk cache of generated OpenAPI test files"""
+
+    def test_miss_generates_and_stores(self, generator, api_spec, build_calls, tmp_path):
+        """Test that the first build renders, checks and fills the cache"""
+        file_path, content, report = generator._build_openapi_test_file(api_spec, "basic")
+
+        assert build_calls == {"render": 1, "check": 1}
+        assert Path(file_path).read_text(encoding="utf-8") == content
+        assert list((tmp_path / GENERATION_CACHE_DIRNAME).iterdir())
+
+    def test_hit_skips_rendering_and_quality_check(self, generator, api_spec, build_calls):
+        """Test that an unchanged endpoint is restored with its stored report"""
+        file_path, content, report = generator._build_openapi_test_file(api_spec, "basic")
+        Path(file_path).unlink()
+
+        cached_path, cached_content, cached_report = generator._build_openapi_test_file(api_spec, "basic")
+
+        assert build_calls == {"render": 1, "check": 1}
+        assert cached_path == file_path
+        assert cached_content == content
+        assert Path(cached_path).read_text(encoding="utf-8") == content
+        assert cached_report.quality_score == report.quality_score
+        assert len(cached_report.issues) == len(report.issues)
+        assert all(issue.severity == original.severity
+                   for issue, original in zip(cached_report.issues, report.issues))
+
+    def test_changed_spec_misses(self, generator, api_spec, build_calls):
+        """Test that a different endpoint spec is generated again"""
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        api_spec["description"] = "Fetch a single user"
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        assert build_calls == {"render": 2, "check": 2}
+
+    def test_settings_change_invalidates(self, generator, api_spec, build_calls):
+        """Test that changing settings such as the base URL regenerates the file"""
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        generator.settings.test_api_base_url = "http://example.invalid:8080"
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        assert build_calls == {"render": 2, "check": 2}
+
+    def test_generation_config_change_invalidates(self, generator, api_spec, build_calls, monkeypatch):
+        """Test that changing quality thresholds in the generation config regenerates the file"""
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        quality = generator.config_manager.config.quality
+        monkeypatch.setattr(quality, "min_quality_score", quality.min_quality_score / 2)
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        assert build_calls == {"render": 2, "check": 2}
+
+    def test_stale_generator_versions_are_pruned(self, generator, api_spec, tmp_path):
+        """Test that entries from another template/generator fingerprint are removed"""
+        stale_entry = tmp_path / GENERATION_CACHE_DIRNAME / "stale-fingerprint" / "entry"
+        stale_entry.mkdir(parents=True)
+
+        generator._build_openapi_test_file(api_spec, "basic")
+
+        cache_root = tmp_path / GENERATION_CACHE_DIRNAME
+        assert [entry.name for entry in cache_root.iterdir()] == [test_generator_module._generator_fingerprint()]
+
+    def test_fingerprint_is_not_computed_per_generator(self, monkeypatch):
+        """Test that constructing generators does no fingerprint I/O"""
+        monkeypatch.setattr(test_generator_module, "_generator_fingerprint",
+                            lambda: pytest.fail("fingerprint computed on construction"))
+
+        TestGenerator()
@@ -0,0 +1,44 @@
+import json
+import pytest
+from src.utils import logging as app_logging
+
+
+pytestmark = pytest.mark.skipif(not app_logging.HAS_ORJSON, reason="orjson not installed")
+
+
+class TestOrjsonSerializer:
+    """Test the orjson-backed log serializer keeps json.dumps output"""
+
+    def test_matches_json_dumps_for_plain_events(self):
+        """Test that ordinary events parse back to the same data"""
+        event = {"event": "generated", "count": 3, "paths": ["/a", "/b"], "missing": None}
+
+        rendered = app_logging._orjson_serializer(event)
+
+        assert json.loads(rendered) == event
+
+    def test_falls_back_for_integers_wider_than_64_bits(self):
+        """Test that big integers are rendered instead of raising"""
+        event = {"event": "big", "value": 2 ** 70}
+
+        rendered = app_logging._orjson_serializer(event)
+
+        assert rendered == json.dumps(event)
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_keeps_non_finite_floats(self, value):
+        """Test that NaN and Infinity are not rendered as null"""
+        event = {"event": "ratio", "metrics": {"value": value}}
+
+        rendered = app_logging._orjson_serializer(event)
+
+        assert rendered == json.dumps(event)
+        assert "null" not in rendered
+
+    def test_fallback_passes_default_through(self):
+        """Test that the renderer's default hook is used on fallback"""
+        event = {"event": "big", "value": 2 ** 70, "obj": object()}
+
+        rendered = app_logging._orjson_serializer(event, default=lambda o: "<obj>")
+
+        assert json.loads(rendered)["obj"] == "<obj>"